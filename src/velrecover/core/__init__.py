@@ -4,7 +4,9 @@
 from .base import (
 
     create_grid,
-    run_interpolation, 
+    run_interpolation,
+    fit_linear_params,
+    fill_grid_from_twt,
     calculate_r2
 )
 
@@ -36,7 +38,8 @@ from .gauss_blur import (
 __all__ = [
     # Base functions
     'load_segy_data', 'load_velocity_data', 'create_grid',
-    'run_interpolation', 'calculate_r2',
+    'run_interpolation', 'calculate_r2', 'fit_linear_params',
+    'fill_grid_from_twt',
     
     # Linear models
     'linear_model', 'custom_linear_model', 'best_linear_fit',
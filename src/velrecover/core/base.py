@@ -6,17 +6,24 @@ from ..utils.console_utils import info_message, error_message, success_message
 
 def create_grid(trace_range, twt_range, ntraces, nsamples):
     """Create grid for interpolation based on SEGY dimensions."""
-    # Generate grid using SEGY dimensions
+    # Generate grid using SEGY dimensions; the coordinate grids are read-only
+    # broadcast views of the two axes, so they take no memory of their own
     vel_traces_grid, vel_twts_grid = np.meshgrid(
         np.linspace(trace_range[0], trace_range[-1], ntraces),
-        np.linspace(twt_range[0], twt_range[-1], nsamples)
+        np.linspace(twt_range[0], twt_range[-1], nsamples),
+        copy=False
     )
+    vel_traces_grid.flags.writeable = False
+    vel_twts_grid.flags.writeable = False
     return vel_traces_grid, vel_twts_grid
 
 def calculate_r2(y_true, y_pred):
     """Calculate the coefficient of determination (R²)"""
-    ss_total = np.sum((y_true - np.mean(y_true)) ** 2)
-    ss_residual = np.sum((y_true - y_pred) ** 2)
+    # Sums of squares as dot products, without squared temporaries
+    centred = y_true - np.mean(y_true)
+    residual = y_true - y_pred
+    ss_total = np.dot(centred, centred)
+    ss_residual = np.dot(residual, residual)
     
     if ss_total == 0:
         return 0  
@@ -25,6 +32,23 @@ def calculate_r2(y_true, y_pred):
     return max(0, r2)
 
 
+def fit_linear_params(basis, values):
+    """Least-squares fit of V = v0 + k·basis, returning (v0, k)."""
+    # Both regression models are linear in v0 and k, so they are solved
+    # directly rather than iterated with a nonlinear solver
+    if len(values) < 2:
+        raise ValueError("At least two velocity picks are needed for a regression")
+    design = np.column_stack((np.ones_like(basis, dtype=np.float64), basis))
+    (v0, k), *_ = np.linalg.lstsq(design, values, rcond=None)
+    return v0, k
+
+def fill_grid_from_twt(model, twt_grid, *params):
+    """Evaluate model(twt, *params) on every point of a velocity grid."""
+    # The model depends on TWT only: evaluate it once and broadcast across traces
+    vel_values_grid = np.empty(twt_grid.shape)
+    vel_values_grid[:] = model(twt_grid[:, 0], *params)[:, np.newaxis]
+    return vel_values_grid
+
 def run_interpolation(vel_traces, vel_twts, vel_values, 
                                interpolation_func, twt_range, trace_range, 
                                ntraces, nsamples, additional_args=None, console=None):
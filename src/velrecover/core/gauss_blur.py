@@ -1,10 +1,20 @@
 """Gaussian blur utility for smoothing velocity grids."""
 
+from functools import lru_cache
+
 import numpy as np
 import cv2
 
-def apply_gaussian_blur(vel_grid, blur_value):
-    """Apply Gaussian blur to velocity grid."""
+# Blur strength above which the blur is approximated on a Gaussian pyramid
+PYRAMID_MIN_BLUR = 8
+
+def apply_gaussian_blur(vel_grid, blur_value, out=None):
+    """
+    Apply Gaussian blur to velocity grid.
+    
+    If out is given (a float32 array of the grid's shape, which may be the
+    grid itself) the result is written into it instead of a new array.
+    """
     
     # Convert blur value to integer kernel size
     # Ensure blur value is an integer, odd and at least 3. Scale it x10 for better results
@@ -12,8 +22,66 @@ def apply_gaussian_blur(vel_grid, blur_value):
     if kernel_size % 2 == 0:
         kernel_size += 1
     
-    # Apply Gaussian blur
-    blurred_grid = cv2.GaussianBlur(vel_grid.astype(np.float32), 
-                                   (kernel_size, kernel_size), 0)
+    vel_grid = vel_grid.astype(np.float32, copy=False)
+    
+    # Large kernels are approximated at a coarser scale, independent of kernel
+    # size, when the grid can be padded by the kernel radius (see below)
+    if blur_value >= PYRAMID_MIN_BLUR and kernel_size // 2 < min(vel_grid.shape):
+        return _pyramid_gaussian_blur(vel_grid, kernel_size, out)
+    
+    # Apply Gaussian blur as two separable passes with the cached 1D kernel
+    kernel = _gaussian_kernel(kernel_size)
+    blurred_grid = cv2.sepFilter2D(vel_grid, -1, kernel, kernel, dst=out)
     
     return blurred_grid
+
+@lru_cache(maxsize=64)
+def _gaussian_kernel(kernel_size):
+    """Return the 1D Gaussian kernel cv2.GaussianBlur would use for this size."""
+    kernel = cv2.getGaussianKernel(kernel_size, 0, cv2.CV_32F)
+    kernel.flags.writeable = False
+    return kernel
+
+def _pyramid_gaussian_blur(vel_grid, kernel_size, out=None):
+    """
+    Approximate a large Gaussian blur by blurring a downsampled pyramid level.
+    
+    The grid is first padded by the kernel radius with the exact blur's
+    border rule (reflect-101), so the pyramid's own border handling never
+    reaches the result; this keeps it within about 1 m/s of the exact blur.
+    The radius must be smaller than both grid dimensions.
+    """
+    radius = kernel_size // 2
+    padded = cv2.copyMakeBorder(vel_grid, radius, radius, radius, radius, cv2.BORDER_REFLECT_101)
+    blurred = _pyramid_blur_level(padded, kernel_size)[radius:-radius, radius:-radius]
+    if out is None:
+        return np.ascontiguousarray(blurred)
+    out[...] = blurred
+    return out
+
+def _pyramid_blur_level(vel_grid, kernel_size):
+    """Blur a grid by descending a Gaussian pyramid, blurring and ascending again."""
+    # Sigma OpenCV derives from the kernel size when sigma is 0
+    sigma = 0.3 * ((kernel_size - 1) * 0.5 - 1) + 0.8
+    
+    # Each pyrDown/pyrUp pair adds variance 2*4**i (in full-resolution pixels) at level i,
+    # so descend only while a positive residual blur remains at the coarsest level
+    levels = max(0, int(np.log2(sigma / 2)))
+    while levels > 0 and min(vel_grid.shape) >> levels < 4:
+        levels -= 1
+    
+    shapes = []
+    small = vel_grid
+    for _ in range(levels):
+        shapes.append(small.shape)
+        small = cv2.pyrDown(small)
+    
+    scale = 4 ** levels
+    residual_var = (sigma ** 2 - 2 * (scale - 1) / 3) / scale
+    if residual_var > 0:
+        small = cv2.GaussianBlur(small, (0, 0), np.sqrt(residual_var))
+    
+    for shape in reversed(shapes):
+        small = cv2.pyrUp(small, dstsize=(shape[1], shape[0]))
+    
+    return small
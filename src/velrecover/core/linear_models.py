@@ -1,9 +1,8 @@
 """Linear interpolation models for velocity analysis."""
 
 import numpy as np
-from scipy.optimize import curve_fit
 
-from .base import calculate_r2, run_interpolation
+from .base import calculate_r2, fill_grid_from_twt, fit_linear_params, run_interpolation
 
 def linear_model(twt, v0, k):
     """Linear velocity model: V = V₀ + k·TWT"""
@@ -13,11 +12,7 @@ def custom_linear_interpolate(vel_traces, vel_twts, vel_values, vel_traces_grid,
                              trace_range, twt_range, v0, k):
     """Custom linear model implementation."""
     # Generate the velocity grid using the specified parameters
-    vel_values_grid = np.zeros_like(vel_traces_grid, dtype=float)
-    
-    # Apply the linear model to each point
-    for i in range(vel_values_grid.shape[1]):  # For each trace
-        vel_values_grid[:, i] = linear_model(vel_twts_grid[:, 0], v0, k)
+    vel_values_grid = fill_grid_from_twt(linear_model, vel_twts_grid, v0, k)
     
     # Calculate R² for the provided model
     predicted = linear_model(vel_twts, v0, k)
@@ -47,21 +42,14 @@ def best_linear_interpolate(vel_traces, vel_twts, vel_values, vel_traces_grid, v
     """Best fit linear model implementation."""
     # Fit linear model to all velocity data using regression
     try:
-        # Initial parameter guess
-        p0 = [1500, 0.5]  # Initial guess: v0=1500, k=0.5
-        params, _ = curve_fit(linear_model, vel_twts, vel_values, p0=p0)
-        v0, k = params
+        v0, k = fit_linear_params(vel_twts, vel_values)
         
         # Calculate R^2 for the regression
         predicted = linear_model(vel_twts, v0, k)
         r2 = calculate_r2(vel_values, predicted)
         
         # Generate the velocity grid using the regression parameters
-        vel_values_grid = np.zeros_like(vel_traces_grid, dtype=float)
-        
-        # Apply the model to each trace
-        for i in range(vel_values_grid.shape[1]):
-            vel_values_grid[:, i] = linear_model(vel_twts_grid[:, 0], v0, k)
+        vel_values_grid = fill_grid_from_twt(linear_model, vel_twts_grid, v0, k)
                 
     except Exception as fit_error:
         return {'error': f"Failed to fit linear model: {str(fit_error)}"}
@@ -1,9 +1,8 @@
 """Logarithmic interpolation models for velocity analysis."""
 
 import numpy as np
-from scipy.optimize import curve_fit
 
-from .base import calculate_r2, run_interpolation
+from .base import calculate_r2, fill_grid_from_twt, fit_linear_params, run_interpolation
 
 def logarithmic_model(twt, v0, k):
     """Logarithmic velocity model: V = V₀ + k·ln(TWT)"""
@@ -14,11 +13,7 @@ def custom_logarithmic_interpolate(vel_traces, vel_twts, vel_values, vel_traces_
                                   trace_range, twt_range, v0, k):
     """Custom logarithmic model implementation."""
     # Generate the velocity grid using the specified parameters
-    vel_values_grid = np.zeros_like(vel_traces_grid, dtype=float)
-    
-    # Apply the logarithmic model to each point
-    for i in range(vel_values_grid.shape[1]):  # For each trace
-        vel_values_grid[:, i] = logarithmic_model(vel_twts_grid[:, 0], v0, k)
+    vel_values_grid = fill_grid_from_twt(logarithmic_model, vel_twts_grid, v0, k)
     
     # Calculate R² for the provided model
     predicted = logarithmic_model(vel_twts, v0, k)
@@ -48,21 +43,15 @@ def best_logarithmic_interpolate(vel_traces, vel_twts, vel_values, vel_traces_gr
     """Best fit logarithmic model implementation."""
     # Fit logarithmic model to all velocity data using regression
     try:
-        # Initial parameter guess
-        p0 = [1500, 1000]  # Initial guess: v0=1500, k=1000
-        params, _ = curve_fit(logarithmic_model, vel_twts, vel_values, p0=p0)
-        v0, k = params
+        # Same TWT offset as logarithmic_model, so the fit matches the model
+        v0, k = fit_linear_params(np.log(vel_twts + 1e-6), vel_values)
         
         # Calculate R^2 for the regression
         predicted = logarithmic_model(vel_twts, v0, k)
         r2 = calculate_r2(vel_values, predicted)
         
         # Generate the velocity grid using the regression parameters
-        vel_values_grid = np.zeros_like(vel_traces_grid, dtype=float)
-        
-        # Apply the model to each trace
-        for i in range(vel_values_grid.shape[1]):
-            vel_values_grid[:, i] = logarithmic_model(vel_twts_grid[:, 0], v0, k)
+        vel_values_grid = fill_grid_from_twt(logarithmic_model, vel_twts_grid, v0, k)
                 
     except Exception as fit_error:
         return {'error': f"Failed to fit logarithmic model: {str(fit_error)}"}
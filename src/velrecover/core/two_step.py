@@ -27,20 +27,22 @@ def two_step_interpolate(vel_traces, vel_twts, vel_values, vel_traces_grid, vel_
     twts_full = np.linspace(min_twt, max_twt, nsamples)
     
     # Initialize velocity grid with NaN (to identify unfilled cells)
-    vel_values_grid = np.zeros_like(vel_traces_grid, dtype=float)
+    vel_values_grid = np.zeros(vel_traces_grid.shape)
     vel_values_grid.fill(np.nan)
     
     # Step 1: Interpolate for each unique trace using RBF
     unique_traces = np.unique(vel_traces)
     
-    # Create mapping from unique traces to column indices
-    trace_to_col_idx = {}
-    for i, grid_trace in enumerate(traces_full):
-        distances = np.abs(unique_traces - grid_trace)
-        if np.min(distances) <= 0.5:  # If within 0.5 of a unique trace
-            closest_trace = unique_traces[np.argmin(distances)]
-            if closest_trace not in trace_to_col_idx:
-                trace_to_col_idx[closest_trace] = i
+    # Create mapping from unique traces to column indices: each unique trace
+    # takes the first grid column within 0.5 of it. Both axes are sorted, so
+    # the closest unique trace is one of the two around each column
+    right = np.clip(np.searchsorted(unique_traces, traces_full), 0, len(unique_traces) - 1)
+    left = np.clip(right - 1, 0, len(unique_traces) - 1)
+    closest = np.where(np.abs(traces_full - unique_traces[left]) <= np.abs(unique_traces[right] - traces_full),
+                       left, right)
+    near_cols = np.flatnonzero(np.abs(unique_traces[closest] - traces_full) <= 0.5)
+    mapped, first = np.unique(closest[near_cols], return_index=True)
+    trace_to_col_idx = dict(zip(unique_traces[mapped], near_cols[first]))
     
     # Process each unique trace
     for i, unique_trace in enumerate(unique_traces):
@@ -91,33 +93,33 @@ def two_step_interpolate(vel_traces, vel_twts, vel_values, vel_traces_grid, vel_
     
     # Step 2: Fill missing traces using nearest neighbor
     # Find columns where we have valid data
-    valid_cols = []
-    for j in range(vel_values_grid.shape[1]):
-        if not np.all(np.isnan(vel_values_grid[:, j])):
-            valid_cols.append(j)
+    valid_mask = ~np.all(np.isnan(vel_values_grid), axis=0)
+    valid_cols = np.flatnonzero(valid_mask)
     
     if len(valid_cols) <= 1:
         return {'error': "Not enough valid traces for interpolation"}
     
-    # Use nearest neighbor to fill all gaps
-    for j in range(vel_values_grid.shape[1]):
-        if j in valid_cols:
-            continue  # Skip columns that already have data
-        
-        # Find nearest valid column (minimum distance)
-        distances = np.array([abs(j - vc) for vc in valid_cols])
-        nearest_col = valid_cols[np.argmin(distances)]
-        
-        # Copy data from nearest column
-        vel_values_grid[:, j] = vel_values_grid[:, nearest_col]
+    # Nearest valid column for every column, preferring the left one on ties
+    cols = np.arange(vel_values_grid.shape[1])
+    right_idx = np.clip(np.searchsorted(valid_cols, cols), 0, len(valid_cols) - 1)
+    left_idx = np.clip(right_idx - 1, 0, len(valid_cols) - 1)
+    left_cols = valid_cols[left_idx]
+    right_cols = valid_cols[right_idx]
+    nearest_cols = np.where(np.abs(cols - left_cols) <= np.abs(right_cols - cols),
+                            left_cols, right_cols)
+    
+    # Copy data from the nearest columns into all gaps in one pass
+    missing_cols = np.flatnonzero(~valid_mask)
+    vel_values_grid[:, missing_cols] = vel_values_grid[:, nearest_cols[missing_cols]]
     
     # Step 3: Apply Gaussian smoothing
     # Calculate kernel size based on blur value (odd number required)
     kernel_size = int(100 * blur_value) // 2 * 2 + 1  # Ensure odd
     kernel_size = max(3, min(kernel_size, 251))  # Limit between 3 and 251
     
-    # Apply Gaussian blur
-    vel_values_grid = cv2.GaussianBlur(vel_values_grid.astype(np.float32), (kernel_size, kernel_size), 0)
+    # Apply Gaussian blur in place on the float32 grid
+    vel_values_grid = vel_values_grid.astype(np.float32, copy=False)
+    cv2.GaussianBlur(vel_values_grid, (kernel_size, kernel_size), 0, dst=vel_values_grid)
     
     # Generate model description
     model_description = f"Two-Step Interpolation (Blur={blur_value})"
@@ -11,11 +11,11 @@ from PySide6.QtWidgets import (
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 
 from ..utils.visualization_utils import SeismicDisplayManager
 from ..utils.velocity_distribution import VelocityDistributionWindow, plot_velocity_distribution
+from ..utils.velocity_import import load_velocity_picks
 from ..utils.console_utils import (
     section_header, success_message, error_message, 
     warning_message, info_message, progress_message,
@@ -59,6 +59,8 @@ class LoadDataTab(QWidget):
         
         # Initialize velocity distribution window
         self.vel_dist_window = None
+        # Pick values last plotted in the distribution window
+        self._dist_plot_source = None
         
         # Set up the user interface
         self._setup_ui()
@@ -173,7 +175,7 @@ class LoadDataTab(QWidget):
                 
                 # Display the data
                 self.display_manager.display()
-                self.canvas.draw()
+                self.canvas.draw_idle()
                 
                 # Check if we can enable the next button
                 self._check_next_button()
@@ -212,9 +214,9 @@ class LoadDataTab(QWidget):
                     info_message(self.console, f"File: {os.path.basename(file_path)}")
                     info_message(self.console, f"Number of picks: {len(vel_traces)}")
                 
-                # Update the display
-                self.display_manager.display()
-                self.canvas.draw()
+                # Only the picks changed; keep the seismic image already on the axes
+                if not self.display_manager.update_picks():
+                    self.canvas.draw_idle()
                 
                 # Check if we can enable the next button
                 self._check_next_button()
@@ -228,37 +230,7 @@ class LoadDataTab(QWidget):
     def _parse_velocity_file(self, file_path):
         """ Parse the velocity file with three columns: trace, twt, velocity"""
         try:
-            # Load the velocity data
-            # Try to auto-detect delimiter from common formats
-            with open(file_path, 'r') as f:
-                # Read first line to detect delimiter and check if it's a header
-                first_line = f.readline().strip()
-                has_header = False
-                
-                # Check if first line contains non-numeric characters (likely a header)
-                if any(not c.isdigit() and c not in '.-+\t, ;' for c in first_line):
-                    has_header = True
-                
-                if '\t' in first_line:
-                    delimiter = '\t'  # Tab-delimited
-                elif ',' in first_line:
-                    delimiter = ','   # Comma-delimited
-                elif ';' in first_line:
-                    delimiter = ';'   # Semicolon-delimited
-                else:
-                    delimiter = None  # Let numpy try to figure it out (space-delimited)
-            
-            # Load the data using numpy, skip header row if detected
-            data = np.loadtxt(file_path, delimiter=delimiter, skiprows=1 if has_header else 0)
-            
-            # Check if the file has three columns
-            if data.shape[1] < 3:
-                raise ValueError("Velocity file must have at least three columns: trace, twt, velocity")
-            
-            # Extract the columns
-            vel_traces = data[:, 0]  # First column: trace number
-            vel_twts = data[:, 1]    # Second column: two-way time
-            vel_values = data[:, 2]  # Third column: velocity value
+            vel_traces, vel_twts, vel_values = load_velocity_picks(file_path)
             
             if self.console:
                 success_message(self.console, f"Velocity data parsed successfully: {len(vel_traces)} picks")
@@ -287,8 +259,18 @@ class LoadDataTab(QWidget):
             return
         
         try:
-            # Get velocity data
-            vel_traces, vel_twts, vel_values = self._parse_velocity_file(self.velocity_file_path)
+            # Use the picks already loaded into the display manager instead of
+            # parsing the file again
+            vel_traces = self.display_manager.vel_traces
+            vel_twts = self.display_manager.vel_twts
+            vel_values = self.display_manager.vel_values
+            
+            # Each load replaces the pick arrays, so the same array means the
+            # window already shows these picks
+            if self.vel_dist_window is not None and vel_values is self._dist_plot_source:
+                self.vel_dist_window.show()
+                self.vel_dist_window.raise_()
+                return
             
             # Create the distribution window if it doesn't exist
             if self.vel_dist_window is None:
@@ -304,6 +286,7 @@ class LoadDataTab(QWidget):
                 vel_traces, vel_twts, vel_values, 
                 console=self.console
             )
+            self._dist_plot_source = vel_values
             
             if self.console:
                 info_message(self.console, "Velocity distribution window displayed")
@@ -324,7 +307,7 @@ class LoadDataTab(QWidget):
         
         # Clear the display manager
         self.display_manager.clear()
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def _proceed_to_next(self):
         """Prepare data and send it to the next tab before proceeding."""
@@ -15,6 +15,7 @@ from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as Navigation
 from matplotlib.figure import Figure
 
 from ..utils.visualization_utils import SeismicDisplayManager
+from ..utils.velocity_import import load_velocity_picks
 from ..utils.console_utils import (
     section_header, success_message, error_message, 
     warning_message, info_message, progress_message,
@@ -267,9 +268,9 @@ class EditTab(QWidget):
                     info_message(self.console, f"Loading velocity data from: {self.velocity_file_path}")
                 self._load_velocity_data(self.velocity_file_path)
             
-            # Display data
-            self.display_manager.display()
-            self.canvas.draw()
+            # Display data; the seismic image stays if the same SEGY is already shown
+            if not self.display_manager.update_picks():
+                self.canvas.draw_idle()
             
             # Save initial state for undo/redo
             self._save_state_to_history()
@@ -296,36 +297,7 @@ class EditTab(QWidget):
     def _load_velocity_data(self, file_path):
         """Load velocity data from file."""
         try:
-            # Try to auto-detect delimiter from common formats
-            with open(file_path, 'r') as f:
-                # Read first line to detect delimiter and check if it's a header
-                first_line = f.readline().strip()
-                has_header = False
-                
-                # Check if first line contains non-numeric characters (likely a header)
-                if any(not c.isdigit() and c not in '.-+\t, ;' for c in first_line):
-                    has_header = True
-                
-                if '\t' in first_line:
-                    delimiter = '\t'  # Tab-delimited
-                elif ',' in first_line:
-                    delimiter = ','   # Comma-delimited
-                elif ';' in first_line:
-                    delimiter = ';'   # Semicolon-delimited
-                else:
-                    delimiter = None  # Let numpy try to figure it out (space-delimited)
-            
-            # Load the data using numpy, skip header row if detected
-            data = np.loadtxt(file_path, delimiter=delimiter, skiprows=1 if has_header else 0)
-            
-            # Check if the file has three columns
-            if data.shape[1] < 3:
-                raise ValueError("Velocity file must have at least three columns: trace, twt, velocity")
-            
-            # Extract the columns
-            self.vel_traces = data[:, 0]  # First column: trace number
-            self.vel_twts = data[:, 1]    # Second column: two-way time
-            self.vel_values = data[:, 2]  # Third column: velocity value
+            self.vel_traces, self.vel_twts, self.vel_values = load_velocity_picks(file_path)
             
             # Update the display manager
             self.display_manager.load_velocity_picks(self.vel_traces, self.vel_twts, self.vel_values)
@@ -357,8 +329,8 @@ class EditTab(QWidget):
         
         # Update the display
         self.display_manager.load_velocity_picks(self.vel_traces, self.vel_twts, self.vel_values)
-        self.display_manager.display()
-        self.canvas.draw()
+        if not self.display_manager.update_picks():
+            self.canvas.draw_idle()
         
         # Enable save button
         self.save_button.setEnabled(True)
@@ -438,20 +410,20 @@ class EditTab(QWidget):
         # Save current state for undo
         self._save_state_to_history()
         
-        # Add the new pick
+        # Add the new pick; start from empty float64 arrays, the dtype the
+        # file parser produces, so the columns never change type
         if self.vel_traces is None:
-            self.vel_traces = np.array([trace])
-            self.vel_twts = np.array([twt])
-            self.vel_values = np.array([velocity])
-        else:
-            self.vel_traces = np.append(self.vel_traces, trace)
-            self.vel_twts = np.append(self.vel_twts, twt)
-            self.vel_values = np.append(self.vel_values, velocity)
+            self.vel_traces = np.empty(0, dtype=np.float64)
+            self.vel_twts = np.empty(0, dtype=np.float64)
+            self.vel_values = np.empty(0, dtype=np.float64)
+        self.vel_traces = np.append(self.vel_traces, trace)
+        self.vel_twts = np.append(self.vel_twts, twt)
+        self.vel_values = np.append(self.vel_values, velocity)
         
         # Update the display
         self.display_manager.load_velocity_picks(self.vel_traces, self.vel_twts, self.vel_values)
-        self.display_manager.display()
-        self.canvas.draw()
+        if not self.display_manager.update_picks():
+            self.canvas.draw_idle()
         
         # Enable save button
         self.save_button.setEnabled(True)
@@ -489,13 +461,14 @@ class EditTab(QWidget):
         # Save current state for undo
         self._save_state_to_history()
         
-        # Update the velocity
+        # Update the velocity on a new array so history snapshots are untouched
+        self.vel_values = self.vel_values.copy()
         self.vel_values[idx] = velocity
         
         # Update the display
         self.display_manager.load_velocity_picks(self.vel_traces, self.vel_twts, self.vel_values)
-        self.display_manager.display()
-        self.canvas.draw()
+        if not self.display_manager.update_picks():
+            self.canvas.draw_idle()
         
         # Enable save button
         self.save_button.setEnabled(True)
@@ -538,8 +511,8 @@ class EditTab(QWidget):
         
         # Update the display
         self.display_manager.load_velocity_picks(self.vel_traces, self.vel_twts, self.vel_values)
-        self.display_manager.display()
-        self.canvas.draw()
+        if not self.display_manager.update_picks():
+            self.canvas.draw_idle()
         
         # Enable save button
         self.save_button.setEnabled(True)
@@ -554,12 +527,12 @@ class EditTab(QWidget):
         if self.vel_traces is None or len(self.vel_traces) == 0:
             return None, float('inf')
 
-        # Calculate the Euclidean distance to all picks
-        distances = np.sqrt((self.vel_traces - trace) ** 2 + (self.vel_twts - twt) ** 2)
+        # Compare squared Euclidean distances; only the closest one needs a root
+        sq_distances = (self.vel_traces - trace) ** 2 + (self.vel_twts - twt) ** 2
 
         # Find the index of the closest pick
-        closest_index = np.argmin(distances)
-        closest_distance = distances[closest_index]
+        closest_index = np.argmin(sq_distances)
+        closest_distance = np.sqrt(sq_distances[closest_index])
 
         return closest_index, closest_distance
 
@@ -638,11 +611,12 @@ class EditTab(QWidget):
         if self.vel_traces is None:
             return
             
-        # Create a copy of the current state
+        # Keep references to the current arrays; edits replace arrays rather
+        # than writing into them, so snapshots stay valid without copying
         state = {
-            "vel_traces": self.vel_traces.copy(),
-            "vel_twts": self.vel_twts.copy(),
-            "vel_values": self.vel_values.copy()
+            "vel_traces": self.vel_traces,
+            "vel_twts": self.vel_twts,
+            "vel_values": self.vel_values
         }
         
         # If we're in the middle of the history, discard future states
@@ -671,14 +645,14 @@ class EditTab(QWidget):
         
         # Restore the state
         state = self.history[self.history_index]
-        self.vel_traces = state["vel_traces"].copy()
-        self.vel_twts = state["vel_twts"].copy()
-        self.vel_values = state["vel_values"].copy()
+        self.vel_traces = state["vel_traces"]
+        self.vel_twts = state["vel_twts"]
+        self.vel_values = state["vel_values"]
         
         # Update the display
         self.display_manager.load_velocity_picks(self.vel_traces, self.vel_twts, self.vel_values)
-        self.display_manager.display()
-        self.canvas.draw()
+        if not self.display_manager.update_picks():
+            self.canvas.draw_idle()
         
         # Enable save button
         self.save_button.setEnabled(True)
@@ -699,14 +673,14 @@ class EditTab(QWidget):
         
         # Restore the state
         state = self.history[self.history_index]
-        self.vel_traces = state["vel_traces"].copy()
-        self.vel_twts = state["vel_twts"].copy()
-        self.vel_values = state["vel_values"].copy()
+        self.vel_traces = state["vel_traces"]
+        self.vel_twts = state["vel_twts"]
+        self.vel_values = state["vel_values"]
         
         # Update the display
         self.display_manager.load_velocity_picks(self.vel_traces, self.vel_twts, self.vel_values)
-        self.display_manager.display()
-        self.canvas.draw()
+        if not self.display_manager.update_picks():
+            self.canvas.draw_idle()
         
         # Enable save button
         self.save_button.setEnabled(True)
@@ -758,4 +732,4 @@ class EditTab(QWidget):
         
         # Clear the display
         self.display_manager.clear()
-        self.canvas.draw()
\ No newline at end of file
+        self.canvas.draw_idle()
\ No newline at end of file
@@ -1,12 +1,14 @@
 """Interpolation tab for VelRecover application."""
 
 import os
+import traceback
+from types import SimpleNamespace
 import numpy as np
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool, QTimer
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
     QGroupBox, QSplitter, QComboBox, QSpinBox, QDoubleSpinBox,
-    QFrame, QFormLayout, QRadioButton, QButtonGroup, QSlider,
+    QFrame, QFormLayout, QRadioButton, QButtonGroup,
     QCheckBox, QFileDialog
 )
 from PySide6.QtGui import QIcon
@@ -16,15 +18,310 @@ from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
 
-from ..utils.console_utils import info_message, warning_message, error_message, success_message
-from ..utils.visualization_utils import SeismicDisplayManager
-from ..utils.velocity_export import save_velocity_text_data, save_velocity_binary_data
+from ..utils.console_utils import info_message, warning_message, error_message, success_message, console_enabled, DEBUG
+from ..utils.visualization_utils import SeismicDisplayManager, MAX_DISPLAY_SIZE
 from ..utils.velocity_distribution import VelocityDistributionWindow, plot_velocity_distribution
-from ..core.linear_models import custom_linear_model, best_linear_fit
-from ..core.logarithmic_models import custom_logarithmic_model, best_logarithmic_fit
-from ..core.rbf_models import interpolate_velocity_data_rbf
-from ..core.two_step import two_step_model
-from ..core.gauss_blur import apply_gaussian_blur
+
+# Rows of the velocity grid colormapped at a time for the overlay
+OVERLAY_BLOCK_ROWS = 128
+
+# Hints for common interpolation failures: (keywords, hint)
+_ERROR_HINTS = (
+    (("memory",), "Not enough memory for this grid. Try a simpler method or close other applications."),
+    (("singular", "linalg"), "The velocity picks are degenerate (duplicate or collinear points). Edit the picks or try another method."),
+    (("not enough valid traces",), "Too few traces contain picks for this method. Add picks or use a regression model."),
+    (("optimal parameters not found", "fit"), "The model could not be fitted to the picks. Try the custom model with manual parameters."),
+)
+
+
+def _compute_interpolation(console, method, vel_traces, vel_twts, vel_values,
+                           trace_range, twt_range, params):
+    """
+    Run an interpolation model and fit its grid to the SEGY dimensions.
+    
+    Runs on a worker thread, so it only sees plain values in params and
+    reports through console, never through widgets.
+    """
+    ntraces = params['ntraces']
+    nsamples = params['nsamples']
+    delay = params['delay']
+    dt_ms = params['dt_ms']
+    
+    if method == "linear_best":
+        from ..core.linear_models import best_linear_fit
+        result = best_linear_fit(
+            vel_traces=vel_traces, 
+            vel_twts=vel_twts, 
+            vel_values=vel_values,
+            twt_range=twt_range,
+            trace_range=trace_range,
+            ntraces=ntraces,
+            nsamples=nsamples,
+            console=console
+        )
+
+    elif method == "linear_custom":
+        v0 = params['linear_v0']
+        k = params['linear_k']
+        from ..core.linear_models import custom_linear_model
+        result = custom_linear_model(
+            vel_traces=vel_traces, 
+            vel_twts=vel_twts, 
+            vel_values=vel_values,
+            twt_range=twt_range,
+            trace_range=trace_range,
+            ntraces=ntraces,
+            nsamples=nsamples,
+            v0=v0, 
+            k=k,
+            console=console
+        )
+
+    elif method == "log_best":
+        from ..core.logarithmic_models import best_logarithmic_fit
+        result = best_logarithmic_fit(
+            vel_traces=vel_traces, 
+            vel_twts=vel_twts, 
+            vel_values=vel_values,
+            twt_range=twt_range,
+            trace_range=trace_range,
+            ntraces=ntraces,
+            nsamples=nsamples,
+            console=console
+        )
+
+    elif method == "log_custom":
+        v0 = params['log_v0']
+        k = params['log_k']
+        from ..core.logarithmic_models import custom_logarithmic_model
+        result = custom_logarithmic_model(
+            vel_traces=vel_traces, 
+            vel_twts=vel_twts, 
+            vel_values=vel_values,
+            twt_range=twt_range,
+            trace_range=trace_range,
+            ntraces=ntraces,
+            nsamples=nsamples,
+            v0=v0, 
+            k=k,
+            console=console
+        )
+
+    elif method == "rbf":
+        from ..core.rbf_models import interpolate_velocity_data_rbf
+        result = interpolate_velocity_data_rbf(
+            vel_traces=vel_traces, 
+            vel_twts=vel_twts, 
+            vel_values=vel_values,
+            twt_range=twt_range,
+            trace_range=trace_range,
+            ntraces=ntraces,
+            nsamples=nsamples,
+            console=console
+        )
+
+    elif method == "two_step":
+        blur_value = params['two_step_blur']
+        from ..core.two_step import two_step_model
+        result = two_step_model(
+            vel_traces=vel_traces, 
+            vel_twts=vel_twts, 
+            vel_values=vel_values,
+            twt_range=twt_range,
+            trace_range=trace_range,
+            ntraces=ntraces,
+            nsamples=nsamples,
+            blur_value=blur_value,
+            console=console
+        )
+
+    else:
+        return {'error': f"Unknown interpolation method: {method}"}
+
+    if 'error' in result:
+        return result
+    
+    # Apply Gaussian blur if enabled
+    if params['blur_enabled'] and 'vel_values_grid' in result:
+        blur_value = params['blur_value']
+        info_message(console, f"Applying Gaussian blur with strength {blur_value}")
+        from ..core.gauss_blur import apply_gaussian_blur
+        # The model grid is not shared yet, so blur it in place
+        grid = result['vel_values_grid'].astype(np.float32, copy=False)
+        result['vel_values_grid'] = apply_gaussian_blur(grid, blur_value, out=grid)
+        # Update model type
+        if 'model_type' in result:
+            result['model_type'] = f"{result['model_type']} + Blur"
+
+    # Ensure the velocity grid matches the SEGY dimensions
+    grid_shape = result['vel_values_grid'].shape
+
+    # Check if resampling is needed
+    if grid_shape[0] != nsamples or grid_shape[1] != ntraces:
+        info_message(console, f"Resampling velocity grid from {grid_shape} to {(nsamples, ntraces)}")
+
+        # The coordinate grids are meshgrids, so their ranges are those of a
+        # single column / row; reduce those once instead of the full grids
+        twt_axis = result['vel_twts_grid'][:, 0]
+        trace_axis = result['vel_traces_grid'][0, :]
+        trace_min, trace_max = np.min(trace_axis), np.max(trace_axis)
+        
+        # Extract original grid coordinates
+        orig_twts = np.linspace(np.min(twt_axis), np.max(twt_axis), grid_shape[0])
+        orig_traces = np.linspace(trace_min, trace_max, grid_shape[1])
+
+        # Create target axes with SEGY dimensions
+        new_twts = np.linspace(delay, delay + (nsamples-1) * dt_ms, nsamples)
+
+        new_traces = np.linspace(trace_min, trace_max, ntraces)
+
+        # Bilinear interpolation on a rectilinear grid is separable: resample
+        # the time axis, then the trace axis, without building a point list
+        new_values = _resample_axis(result['vel_values_grid'], orig_twts, new_twts, axis=0)
+        new_values = _resample_axis(new_values, orig_traces, new_traces, axis=1)
+
+        # Update result with resampled grid
+        new_traces_grid, new_twts_grid = np.meshgrid(new_traces, new_twts, copy=False)
+        new_traces_grid.flags.writeable = False
+        new_twts_grid.flags.writeable = False
+        result['vel_values_grid'] = new_values
+        result['vel_twts_grid'] = new_twts_grid
+        result['vel_traces_grid'] = new_traces_grid
+
+        info_message(console, "Resampling complete")
+
+    # Keep the velocity grid as float32 to halve memory traffic in display and export
+    result['vel_values_grid'] = result['vel_values_grid'].astype(np.float32, copy=False)
+    # The grid is shared by reference with the main window, the display and the
+    # exporters, so freeze it rather than letting any of them copy defensively
+    result['vel_values_grid'].flags.writeable = False
+    
+    # Colormap the overlay here, in the same worker pass that finalized the
+    # grid, so the GUI thread only has to hand the bytes to matplotlib
+    result['vel_rgba'] = _colormap_overlay(result['vel_values_grid'], *params['color_range'])
+    return result
+
+
+def _resample_axis(values, src, dst, axis):
+    """
+    Linearly interpolate values from src to dst coordinates along one axis.
+    
+    Points outside src are extrapolated from the edge intervals, like
+    RegularGridInterpolator with fill_value=None.
+    """
+    if len(src) < 2:
+        return np.repeat(values, len(dst), axis=axis)
+    lo = np.clip(np.searchsorted(src, dst, side='right') - 1, 0, len(src) - 2)
+    weight = (dst - src[lo]) / (src[lo + 1] - src[lo])
+    weight = weight.reshape((-1, 1) if axis == 0 else (1, -1))
+    lower = np.take(values, lo, axis=axis).astype(np.float64, copy=False)
+    upper = np.take(values, lo + 1, axis=axis).astype(np.float64, copy=False)
+    return lower + (upper - lower) * weight
+
+
+def _colormap_overlay(vel_values_grid, vmin, vmax):
+    """
+    Map a velocity grid through the jet colormap into RGBA bytes.
+    
+    NaNs map to the transparent "bad" color, as with a scalar image. Grids
+    larger than the display limit are subsampled first, keeping the first and
+    last rows and columns; the velocity field is smooth at that scale.
+    """
+    nrows, ncols = vel_values_grid.shape
+    if nrows > MAX_DISPLAY_SIZE or ncols > MAX_DISPLAY_SIZE:
+        rows = np.linspace(0, nrows - 1, min(nrows, MAX_DISPLAY_SIZE)).round().astype(np.intp)
+        cols = np.linspace(0, ncols - 1, min(ncols, MAX_DISPLAY_SIZE)).round().astype(np.intp)
+        vel_values_grid = vel_values_grid[np.ix_(rows, cols)]
+    
+    # Same lookup as Normalize followed by the colormap, but fused and done a
+    # block of rows at a time, so the temporaries stay small instead of
+    # being full-grid float, mask and index arrays
+    cmap = plt.get_cmap('jet')
+    n = cmap.N
+    lut = np.vstack((cmap(np.arange(n)), cmap.get_under(), cmap.get_over(), cmap.get_bad()))
+    lut = (lut * 255).astype(np.uint8)
+    
+    dtype = np.promote_types(vel_values_grid.dtype, np.float32)
+    rgba = np.empty(vel_values_grid.shape + (4,), dtype=np.uint8)
+    for start in range(0, vel_values_grid.shape[0], OVERLAY_BLOCK_ROWS):
+        x = np.array(vel_values_grid[start:start + OVERLAY_BLOCK_ROWS], dtype=dtype)
+        if vmin == vmax:
+            x.fill(0)
+        else:
+            x -= vmin
+            x /= (vmax - vmin)
+            x *= n
+        x[x == n] = n - 1
+        under = x < 0
+        over = x >= n
+        bad = np.isnan(x)
+        with np.errstate(invalid='ignore'):
+            index = x.astype(np.intp)
+        index[under] = n
+        index[over] = n + 1
+        index[bad] = n + 2
+        lut.take(index, axis=0, mode='clip', out=rgba[start:start + OVERLAY_BLOCK_ROWS])
+    return rgba
+
+
+class ConsoleRelay:
+    """Console stand-in that forwards appended text through a Qt signal."""
+    
+    def __init__(self, signal):
+        self._signal = signal
+    
+    def append(self, text):
+        self._signal.emit(text)
+
+
+class InterpolationSignals(QObject):
+    """Signals emitted by an interpolation task."""
+    message = Signal(str)
+    finished = Signal(object)
+    failed = Signal(str, str)
+
+
+class InterpolationTask(QRunnable):
+    """Runs an interpolation function on the global thread pool."""
+    
+    def __init__(self, function, *args):
+        super().__init__()
+        self.signals = InterpolationSignals()
+        self.function = function
+        self.args = args
+    
+    def run(self):
+        try:
+            result = self.function(ConsoleRelay(self.signals.message), *self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e), traceback.format_exc())
+        else:
+            self.signals.finished.emit(result)
+
+
+class ExportSignals(QObject):
+    """Signals emitted by an export task."""
+    finished = Signal(str, object)  # Format type, result of the export function
+
+
+class ExportTask(QRunnable):
+    """Writes a velocity export file on the global thread pool."""
+    
+    def __init__(self, format_type, function, *args):
+        super().__init__()
+        self.signals = ExportSignals()
+        self.format_type = format_type
+        self.function = function
+        self.args = args
+    
+    def run(self):
+        # The export functions report failures in their result; anything
+        # else that escapes is reported the same way
+        try:
+            result = self.function(*self.args)
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+        self.signals.finished.emit(self.format_type, result)
 
 
 class SimpleNavigationToolbar(NavigationToolbar):
@@ -44,6 +341,9 @@ class InterpolateTab(QWidget):
     interpolationCompleted = Signal(dict)  # Interpolated data
     proceedRequested = Signal()
     
+    # Delay before the method panel follows the dropdown
+    METHOD_CHANGE_DELAY_MS = 50
+    
     def __init__(self, console, work_dir, parent=None):
         super().__init__(parent)
         self.setObjectName("interpolate_tab")
@@ -55,7 +355,12 @@ class InterpolateTab(QWidget):
         self.interpolated_data = None
         self.current_method = "linear"
         self.blur_enabled = False
-        self.blur_value = 2.5  # Default blur value
+        self.blur_value = 2.5
+        self._interpolation_task = None
+        # Bumped whenever the input data changes, so results of runs started
+        # on earlier data are dropped when they finish
+        self._run_generation = 0
+        self._export_tasks = {}  # Running export task per format type
         
         # Create a single canvas for both input display and results
         self.figure = Figure(constrained_layout=True)
@@ -72,6 +377,8 @@ class InterpolateTab(QWidget):
         
         # Initialize velocity distribution window
         self.vel_dist_window = None
+        # Data last plotted in the distribution window
+        self._dist_plot_source = None
         
         self._setup_ui()
     
@@ -166,6 +473,11 @@ class InterpolateTab(QWidget):
         self.save_txt_button.clicked.connect(lambda: self._save_velocity_data("text"))
         button_layout.addWidget(self.save_txt_button)
         
+        # Write the text export gzip-compressed, as .dat.gz
+        self.compress_txt_checkbox = QCheckBox("Compress (.dat.gz)")
+        self.compress_txt_checkbox.setObjectName("compress_txt_checkbox")
+        button_layout.addWidget(self.compress_txt_checkbox)
+        
         # Save as Binary button
         self.save_bin_button = QPushButton("Save as Binary")
         self.save_bin_button.setObjectName("save_bin_button")
@@ -211,7 +523,13 @@ class InterpolateTab(QWidget):
 
         self.method_dropdown.setCurrentIndex(4) # Default to RBF Interpolation
         
-        self.method_dropdown.currentIndexChanged.connect(self._on_method_changed)
+        # Scrolling through the methods fires a change per item; only the
+        # last one within METHOD_CHANGE_DELAY_MS updates the panel
+        self._method_change_timer = QTimer(self)
+        self._method_change_timer.setSingleShot(True)
+        self._method_change_timer.setInterval(self.METHOD_CHANGE_DELAY_MS)
+        self._method_change_timer.timeout.connect(self._on_method_changed)
+        self.method_dropdown.currentIndexChanged.connect(self._method_change_timer.start)
         dropdown_layout.addWidget(self.method_dropdown)
         
         # Add description label below dropdown
@@ -250,20 +568,15 @@ class InterpolateTab(QWidget):
         blur_strength_label.setObjectName("blur_strength_label")
         blur_layout.addWidget(blur_strength_label)
         
-        self.blur_slider = QSlider(Qt.Horizontal)
-        self.blur_slider.setObjectName("blur_slider")
-        self.blur_slider.setMinimum(0)
-        self.blur_slider.setMaximum(100)
-        self.blur_slider.setValue(5)  # Default value
-        self.blur_slider.setEnabled(False)
-        self.blur_slider.valueChanged.connect(self._on_blur_value_changed)
-        self.blur_slider.setMinimumWidth(150)
-        blur_layout.addWidget(self.blur_slider)
-        
-        self.blur_value_label = QLabel("2.5")
-        self.blur_value_label.setObjectName("blur_value_label")
-        self.blur_value_label.setFixedWidth(30)
-        blur_layout.addWidget(self.blur_value_label)
+        self.blur_spinbox = QDoubleSpinBox()
+        self.blur_spinbox.setObjectName("blur_spinbox")
+        self.blur_spinbox.setRange(0.5, 100)
+        self.blur_spinbox.setValue(self.blur_value)  # Default value
+        self.blur_spinbox.setSingleStep(0.5)
+        self.blur_spinbox.valueChanged.connect(self._on_blur_value_changed)
+        self.blur_spinbox.setEnabled(False)
+        self.blur_spinbox.setMinimumWidth(150)
+        blur_layout.addWidget(self.blur_spinbox)
         
         # Add stretch to push everything to the top
         blur_layout.addStretch()        
@@ -294,83 +607,100 @@ class InterpolateTab(QWidget):
     
     def _on_method_changed(self):
         """Handle method selection change."""
-        self._update_method_description()
-        self._create_method_params()
+        # Swap the description and parameter frames in a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_method_description()
+            self._update_method_params()
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _create_method_params(self):
-        """Create parameter interfaces for each interpolation method."""
-        # Clear any existing widgets
-        for i in reversed(range(self.params_layout.count())):
-            widget = self.params_layout.itemAt(i).widget()
-            if widget:
-                widget.deleteLater()
+        """Create parameter interfaces for each interpolation method once."""
+        # Label shown for methods that don't need parameters
+        self.no_params_label = QLabel()
+        self.no_params_label.setObjectName("no_params_label")
+        self.params_layout.addWidget(self.no_params_label)
+        
+        # Linear custom parameters
+        linear_frame = QFrame()
+        params_layout = QFormLayout(linear_frame)
+        
+        # V0 parameter (initial velocity)
+        self.v0_linear = QDoubleSpinBox()
+        self.v0_linear.setRange(1000, 10000)
+        self.v0_linear.setValue(1500)
+        self.v0_linear.setSuffix(" m/s")
+        self.v0_linear.setObjectName("v0_linear")
+        params_layout.addRow("Initial Velocity (V₀):", self.v0_linear)
+        
+        # k parameter (velocity gradient)
+        self.k_linear = QDoubleSpinBox()
+        self.k_linear.setRange(0.1, 10)
+        self.k_linear.setValue(0.5)
+        self.k_linear.setSingleStep(0.1)
+        self.k_linear.setObjectName("k_linear")
+        params_layout.addRow("Velocity Gradient (k):", self.k_linear)
+        
+        self.params_layout.addWidget(linear_frame)
+        
+        # Logarithmic custom parameters
+        log_frame = QFrame()
+        params_layout = QFormLayout(log_frame)
+        
+        # V0 parameter (base velocity)
+        self.v0_log = QDoubleSpinBox()
+        self.v0_log.setRange(1000, 10000)
+        self.v0_log.setValue(1500)
+        self.v0_log.setSuffix(" m/s")
+        self.v0_log.setObjectName("v0_log")
+        params_layout.addRow("Base Velocity (V₀):", self.v0_log)
+        
+        # k parameter (logarithmic factor)
+        self.k_log = QDoubleSpinBox()
+        self.k_log.setRange(500, 3000)
+        self.k_log.setValue(1000)
+        self.k_log.setSingleStep(50)
+        self.k_log.setObjectName("k_log")
+        params_layout.addRow("Logarithmic Factor (k):", self.k_log)
+        
+        self.params_layout.addWidget(log_frame)
+        
+        # Two-step parameters
+        two_step_frame = QFrame()
+        params_layout = QFormLayout(two_step_frame)
+        
+        # Blur value for two-step method
+        self.blur_two_step = QDoubleSpinBox()
+        self.blur_two_step.setRange(1, 10)
+        self.blur_two_step.setValue(2.5)
+        self.blur_two_step.setSingleStep(0.5)
+        self.blur_two_step.setObjectName("blur_two_step")
+        params_layout.addRow("Smoothing Factor:", self.blur_two_step)
+        
+        self.params_layout.addWidget(two_step_frame)
+        
+        self.param_frames = {
+            "linear_custom": linear_frame,
+            "log_custom": log_frame,
+            "two_step": two_step_frame
+        }
         
-        # Get selected method
+        self._update_method_params()
+    
+    def _update_method_params(self):
+        """Show only the parameter interface for the selected method."""
         selected_method = self._get_selected_method()
         
-        if selected_method in ["linear_best", "log_best", "rbf"]:
+        for method_id, frame in self.param_frames.items():
+            frame.setVisible(method_id == selected_method)
+        
+        if selected_method in self.param_frames:
+            self.no_params_label.setVisible(False)
+        else:
             # These methods don't need parameters
-            label = QLabel(f"No configuration needed for {self._get_method_display_name(selected_method)}.")
-            label.setObjectName("no_params_label")
-            self.params_layout.addWidget(label)
-            
-        elif selected_method == "linear_custom":
-            params_frame = QFrame()
-            params_layout = QFormLayout(params_frame)
-            
-            # V0 parameter (initial velocity)
-            self.v0_linear = QDoubleSpinBox()
-            self.v0_linear.setRange(1000, 10000)
-            self.v0_linear.setValue(1500)
-            self.v0_linear.setSuffix(" m/s")
-            self.v0_linear.setObjectName("v0_linear")
-            params_layout.addRow("Initial Velocity (V₀):", self.v0_linear)
-            
-            # k parameter (velocity gradient)
-            self.k_linear = QDoubleSpinBox()
-            self.k_linear.setRange(0.1, 10)
-            self.k_linear.setValue(0.5)
-            self.k_linear.setSingleStep(0.1)
-            self.k_linear.setObjectName("k_linear")
-            params_layout.addRow("Velocity Gradient (k):", self.k_linear)
-            
-            self.params_layout.addWidget(params_frame)
-            
-        elif selected_method == "log_custom":
-            params_frame = QFrame()
-            params_layout = QFormLayout(params_frame)
-            
-            # V0 parameter (base velocity)
-            self.v0_log = QDoubleSpinBox()
-            self.v0_log.setRange(1000, 10000)
-            self.v0_log.setValue(1500)
-            self.v0_log.setSuffix(" m/s")
-            self.v0_log.setObjectName("v0_log")
-            params_layout.addRow("Base Velocity (V₀):", self.v0_log)
-            
-            # k parameter (logarithmic factor)
-            self.k_log = QDoubleSpinBox()
-            self.k_log.setRange(500, 3000)
-            self.k_log.setValue(1000)
-            self.k_log.setSingleStep(50)
-            self.k_log.setObjectName("k_log")
-            params_layout.addRow("Logarithmic Factor (k):", self.k_log)
-            
-            self.params_layout.addWidget(params_frame)
-            
-        elif selected_method == "two_step":
-            params_frame = QFrame()
-            params_layout = QFormLayout(params_frame)
-            
-            # Blur value for two-step method
-            self.blur_two_step = QDoubleSpinBox()
-            self.blur_two_step.setRange(1, 10)
-            self.blur_two_step.setValue(2.5)
-            self.blur_two_step.setSingleStep(0.5)
-            self.blur_two_step.setObjectName("blur_two_step")
-            params_layout.addRow("Smoothing Factor:", self.blur_two_step)
-            
-            self.params_layout.addWidget(params_frame)
+            self.no_params_label.setText(f"No configuration needed for {self._get_method_display_name(selected_method)}.")
+            self.no_params_label.setVisible(True)
     
     def _get_selected_method(self):
         """Get the currently selected interpolation method."""
@@ -391,22 +721,26 @@ class InterpolateTab(QWidget):
     def _on_blur_toggled(self, checked):
         """Handle blur checkbox toggle."""
         self.blur_enabled = checked
-        self.blur_slider.setEnabled(checked)
+        self.blur_spinbox.setEnabled(checked)
     
     def _on_blur_value_changed(self, value):
-        """Handle blur slider value change."""
-        self.blur_value = value 
-        self.blur_value_label.setText(f"{self.blur_value:.1f}")
+        """Keep the blur strength in sync with the spinbox."""
+        self.blur_value = value
+    
+    def _invalidate_interpolation(self):
+        """Forget any running interpolation; its result will be dropped."""
+        self._run_generation += 1
+        self._interpolation_task = None
+        self.run_button.setEnabled(True)
     
     def update_with_data(self, velocity_data):
         """Update the tab with velocity data."""
+        self._invalidate_interpolation()
         self.velocity_data = velocity_data
         self.interpolated_data = None
         
         # Reset UI state
-        self.reset_button.setEnabled(False)
-        self.save_txt_button.setEnabled(False)
-        self.save_bin_button.setEnabled(False)
+        self._set_result_buttons_enabled(False)
         
         # Display the velocity data
         self._display_velocity_data()
@@ -416,18 +750,7 @@ class InterpolateTab(QWidget):
         if self.velocity_data is None:
             return
         
-        # Clear the plot and any previous results
-        self.ax.clear()
-        
-        # Properly handle colorbar removal to avoid errors
-        if self.velocity_colorbar is not None:
-            try:
-                self.velocity_colorbar.remove()
-            except (KeyError, AttributeError):
-                # Handle the case where colorbar removal fails
-                pass
-            self.velocity_colorbar = None
-            
+        # Previous results go with the axes, which the display manager clears
         self.interpolation_overlay = None
         
         # Extract velocity data using the edit tab's field names
@@ -456,18 +779,23 @@ class InterpolateTab(QWidget):
         self.dt_ms = self.segy_metadata.get('dt_ms')
         self.delay = self.segy_metadata.get('delay')
         
-        # Create a dummy mappable for the colorbar
-        sm = plt.cm.ScalarMappable(cmap='jet', norm=plt.Normalize(vmin=self.vel_min, vmax=self.vel_max))
-        sm.set_array([])
-        
-        # Add a single colorbar
-        self.velocity_colorbar = self.figure.colorbar(sm, ax=self.ax)
-        self.velocity_colorbar.set_label('Velocity (m/s)')
+        # The colorbar lives on its own axes, so it survives clearing the plot;
+        # retarget its range instead of rebuilding it
+        if self.velocity_colorbar is not None and self.velocity_colorbar.ax in self.figure.axes:
+            self.velocity_colorbar.mappable.set_clim(self.vel_min, self.vel_max)
+        else:
+            # Create a dummy mappable for the colorbar
+            sm = plt.cm.ScalarMappable(cmap='jet', norm=plt.Normalize(vmin=self.vel_min, vmax=self.vel_max))
+            sm.set_array([])
+            
+            # Add a single colorbar
+            self.velocity_colorbar = self.figure.colorbar(sm, ax=self.ax)
+            self.velocity_colorbar.set_label('Velocity (m/s)')
         
         self.status_label.setText("Displaying SEGY with velocity picks")
         
         # Draw the figure
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def _display_interpolation_result(self):
         """Display the interpolation result overlay."""
@@ -483,41 +811,37 @@ class InterpolateTab(QWidget):
             error_message(self.console, "Interpolation failed: missing grid data")
             return
         
-        # Remove existing overlay if any
-        if self.interpolation_overlay is not None:
-            try:
-                self.interpolation_overlay.remove()
-            except (KeyError, AttributeError):
-                pass
-        
-        # Use the stored velocity range from original velocity picks for consistent coloring
-        vmin = self.vel_min
-        vmax = self.vel_max
-        
-        # Get the SEGY axes limits to make sure our overlay matches exactly
-        x_min, x_max = self.ax.get_xlim()
-        y_min, y_max = self.ax.get_ylim()
-        
-        # Add interpolation as an overlay with transparency, using exact SEGY limits
-        self.interpolation_overlay = self.ax.imshow(
-            vel_values_grid, cmap='jet', aspect='auto',
-            extent=[x_min, x_max, y_min, y_max],
-            alpha=0.5,  
-            vmin=vmin, vmax=vmax,  
-            zorder=5  
-        )
+        # The overlay is shown as RGBA bytes colormapped with the picks' velocity
+        # range, so each redraw (pan, zoom, resize) only resamples the image
+        # instead of normalizing and colormapping the float grid again
+        rgba = self.interpolated_data.get('vel_rgba')
+        if rgba is None:
+            rgba = _colormap_overlay(vel_values_grid, self.vel_min, self.vel_max)
         
-        info_message(self.console, f"Displayed interpolation overlay with axis limits: x=[{x_min}, {x_max}], y=[{y_min}, {y_max}]")
-        
-        if self.velocity_colorbar is not None:
-            try:
-                self.velocity_colorbar.update_normal(self.interpolation_overlay)
-            except (KeyError, AttributeError):
-                try:
-                    self.velocity_colorbar.remove()
-                except (KeyError, AttributeError):
-                    pass
-                self.velocity_colorbar = self.figure.colorbar(self.interpolation_overlay, ax=self.ax)
+        if self.interpolation_overlay is not None:
+            # Reuse the existing overlay image; extent and color range are unchanged
+            self.interpolation_overlay.set_data(rgba)
+        else:
+            # Get the SEGY axes limits to make sure our overlay matches exactly
+            x_min, x_max = self.ax.get_xlim()
+            y_min, y_max = self.ax.get_ylim()
+            
+            # Add interpolation as an overlay with transparency, using exact SEGY limits
+            self.interpolation_overlay = self.ax.imshow(
+                rgba, aspect='auto',
+                extent=[x_min, x_max, y_min, y_max],
+                alpha=0.5,  
+                zorder=5  
+            )
+            
+            if console_enabled(DEBUG):
+                info_message(self.console, f"Displayed interpolation overlay with axis limits: x=[{x_min}, {x_max}], y=[{y_min}, {y_max}]")
+            
+            # The colorbar set up with the picks already uses the same colormap and range
+            if self.velocity_colorbar is None:
+                sm = plt.cm.ScalarMappable(cmap='jet', norm=plt.Normalize(vmin=self.vel_min, vmax=self.vel_max))
+                sm.set_array([])
+                self.velocity_colorbar = self.figure.colorbar(sm, ax=self.ax)
                 self.velocity_colorbar.set_label('Velocity (m/s)')
         
         # Update title and status
@@ -526,15 +850,19 @@ class InterpolateTab(QWidget):
         self.ax.set_title(f'Interpolated Velocity Model: {model_type}')
         self.status_label.setText(f"Displaying interpolation result: {model_type}")
         
-        # Draw the figure
-        self.canvas.draw()
+        # Schedule a redraw for the next event loop pass
+        self.canvas.draw_idle()
     
     def run_interpolation(self):
-        """Run the selected interpolation method."""
+        """Start the selected interpolation method on a worker thread."""
         if self.velocity_data is None:
             warning_message(self.console, "No velocity data available for interpolation")
             return
         
+        if self._interpolation_task is not None:
+            warning_message(self.console, "An interpolation is already running")
+            return
+        
         # Get selected method
         method = self._get_selected_method()
         info_message(self.console, f"Running interpolation using {self._get_method_display_name(method)}...")
@@ -554,167 +882,108 @@ class InterpolateTab(QWidget):
         twt_range = (self.delay, self.delay + (self.nsamples - 1) * self.dt_ms)
         
         info_message(self.console, f"Using trace range {trace_range} and TWT range {twt_range} from SEGY dimensions")
-
-
-        # Run the appropriate interpolation method using the already loaded data
+        
+        # Read widget values here, widgets must not be touched from the worker thread
+        params = {
+            'linear_v0': self.v0_linear.value(),
+            'linear_k': self.k_linear.value(),
+            'log_v0': self.v0_log.value(),
+            'log_k': self.k_log.value(),
+            'two_step_blur': self.blur_two_step.value(),
+            'blur_enabled': self.blur_enabled,
+            'blur_value': self.blur_value,
+            'ntraces': self.ntraces,
+            'nsamples': self.nsamples,
+            'delay': self.delay,
+            'dt_ms': self.dt_ms,
+            'color_range': (self.vel_min, self.vel_max),
+        }
+        
+        task = InterpolationTask(
+            _compute_interpolation, method, vel_traces, vel_twts, vel_values,
+            trace_range, twt_range, params
+        )
+        generation = self._run_generation
+        task.signals.message.connect(self.console.append, Qt.QueuedConnection)
+        task.signals.finished.connect(
+            lambda result: self._on_interpolation_finished(result, generation), Qt.QueuedConnection)
+        task.signals.failed.connect(
+            lambda error, details: self._on_interpolation_failed(error, details, generation),
+            Qt.QueuedConnection)
+        self._interpolation_task = task
+        self.run_button.setEnabled(False)
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_interpolation_finished(self, result, generation):
+        """Store and display the result of a finished interpolation."""
+        if generation != self._run_generation:
+            # Started on data that has since been replaced
+            return
+        self._interpolation_task = None
+        self.run_button.setEnabled(True)
+        
+        # Models report failures in the result instead of raising
+        if 'error' in result:
+            error_message(self.console, f"Interpolation failed: {result['error']}")
+            lower = str(result['error']).lower()
+            for keywords, hint in _ERROR_HINTS:
+                if any(keyword in lower for keyword in keywords):
+                    info_message(self.console, hint)
+                    break
+            return
+        
         try:
-            if method == "linear_best":
-                result = best_linear_fit(
-                    vel_traces=vel_traces, 
-                    vel_twts=vel_twts, 
-                    vel_values=vel_values,
-                    twt_range=twt_range,
-                    trace_range=trace_range,
-                    ntraces=self.ntraces,
-                    nsamples=self.nsamples,
-                    console=self.console
-                )
-            
-            elif method == "linear_custom":
-                v0 = self.v0_linear.value()
-                k = self.k_linear.value()
-                result = custom_linear_model(
-                    vel_traces=vel_traces, 
-                    vel_twts=vel_twts, 
-                    vel_values=vel_values,
-                    twt_range=twt_range,
-                    trace_range=trace_range,
-                    ntraces=self.ntraces,
-                    nsamples=self.nsamples,
-                    v0=v0, 
-                    k=k,
-                    console=self.console
-                )
-            
-            elif method == "log_best":
-                result = best_logarithmic_fit(
-                    vel_traces=vel_traces, 
-                    vel_twts=vel_twts, 
-                    vel_values=vel_values,
-                    twt_range=twt_range,
-                    trace_range=trace_range,
-                    ntraces=self.ntraces,
-                    nsamples=self.nsamples,
-                    console=self.console
-                )
-            
-            elif method == "log_custom":
-                v0 = self.v0_log.value()
-                k = self.k_log.value()
-                result = custom_logarithmic_model(
-                    vel_traces=vel_traces, 
-                    vel_twts=vel_twts, 
-                    vel_values=vel_values,
-                    twt_range=twt_range,
-                    trace_range=trace_range,
-                    ntraces=self.ntraces,
-                    nsamples=self.nsamples,
-                    v0=v0, 
-                    k=k,
-                    console=self.console
-                )
-            
-            elif method == "rbf":
-                result = interpolate_velocity_data_rbf(
-                    vel_traces=vel_traces, 
-                    vel_twts=vel_twts, 
-                    vel_values=vel_values,
-                    twt_range=twt_range,
-                    trace_range=trace_range,
-                    ntraces=self.ntraces,
-                    nsamples=self.nsamples,
-                    console=self.console
-                )
-            
-            elif method == "two_step":
-                blur_value = self.blur_two_step.value()
-                result = two_step_model(
-                    vel_traces=vel_traces, 
-                    vel_twts=vel_twts, 
-                    vel_values=vel_values,
-                    twt_range=twt_range,
-                    trace_range=trace_range,
-                    ntraces=self.ntraces,
-                    nsamples=self.nsamples,
-                    blur_value=blur_value,
-                    console=self.console
-                )
-            
-            else:
-                error_message(self.console, f"Unknown interpolation method: {method}")
-                return
-            
-            # Apply Gaussian blur if enabled
-            if self.blur_enabled and 'vel_values_grid' in result:
-                info_message(self.console, f"Applying Gaussian blur with strength {self.blur_value}")
-                result['vel_values_grid'] = apply_gaussian_blur(result['vel_values_grid'], self.blur_value)
-                # Update model type
-                if 'model_type' in result:
-                    result['model_type'] = f"{result['model_type']} + Blur"
-            
-            # Ensure the velocity grid matches the SEGY dimensions
-            grid_shape = result['vel_values_grid'].shape
-            
-            # Check if resampling is needed
-            if grid_shape[0] != self.nsamples or grid_shape[1] != self.ntraces:
-                info_message(self.console, f"Resampling velocity grid from {grid_shape} to {(self.nsamples, self.ntraces)}")
-                
-                # Create new grid with SEGY dimensions
-                from scipy.interpolate import RegularGridInterpolator
-                
-                # Extract original grid coordinates
-                orig_twts = np.linspace(np.min(result['vel_twts_grid']), np.max(result['vel_twts_grid']), grid_shape[0])
-                orig_traces = np.linspace(np.min(result['vel_traces_grid']), np.max(result['vel_traces_grid']), grid_shape[1])
-                
-                # Create interpolator from original grid
-                interp_func = RegularGridInterpolator(
-                    (orig_twts, orig_traces), 
-                    result['vel_values_grid'],
-                    bounds_error=False,
-                    fill_value=None
-                )
-                
-                # Create target grid with SEGY dimensions
-                new_twts = np.linspace(self.delay, self.delay + (self.nsamples-1) * self.dt_ms, self.nsamples)
-                
-                trace_min = np.min(result['vel_traces_grid'])
-                trace_max = np.max(result['vel_traces_grid'])
-                new_traces = np.linspace(trace_min, trace_max, self.ntraces)
-                
-                # Create points to interpolate
-                new_twts_grid, new_traces_grid = np.meshgrid(new_twts, new_traces, indexing='ij')
-                points = np.column_stack((new_twts_grid.ravel(), new_traces_grid.ravel()))
-                
-                # Perform interpolation
-                new_values = interp_func(points).reshape(self.nsamples, self.ntraces)
-                
-                # Update result with resampled grid
-                result['vel_values_grid'] = new_values
-                result['vel_twts_grid'] = new_twts_grid
-                result['vel_traces_grid'] = new_traces_grid
-                
-                info_message(self.console, "Resampling complete")
-            
             # Store the result
             self.interpolated_data = result
             
             # Display the result
             self._display_interpolation_result()
             
-            # Update UI state
-            self.reset_button.setEnabled(True)
-            # Enable save buttons now that we have interpolation results
-            self.save_txt_button.setEnabled(True)
-            self.save_bin_button.setEnabled(True)
+            # Enable reset and save now that we have interpolation results
+            self._set_result_buttons_enabled(True)
             # Signal that interpolation is complete
             self.interpolationCompleted.emit(result)
             
             success_message(self.console, "Interpolation completed successfully")
             
         except Exception as e:
-            error_message(self.console, f"Interpolation failed: {str(e)}")
-            import traceback
-            error_message(self.console, traceback.format_exc())
+            self._on_interpolation_failed(str(e), traceback.format_exc(), generation)
+    
+    def _on_interpolation_failed(self, error, details, generation):
+        """Report an interpolation that raised on the worker thread."""
+        if generation != self._run_generation:
+            return
+        self._interpolation_task = None
+        self.run_button.setEnabled(True)
+        error_message(self.console, f"Interpolation failed: {error}")
+        error_message(self.console, details)
+    
+    def _set_result_buttons_enabled(self, enabled):
+        """Enable or disable the reset and save buttons in a single repaint."""
+        self.setUpdatesEnabled(False)
+        try:
+            self.reset_button.setEnabled(enabled)
+            self.save_txt_button.setEnabled(enabled)
+            self.save_bin_button.setEnabled(enabled)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def reset(self):
+        """Reset the tab to its initial state."""
+        self._invalidate_interpolation()
+        self.velocity_data = None
+        self.interpolated_data = None
+        self.interpolation_overlay = None
+        
+        # Reset button states
+        self._set_result_buttons_enabled(False)
+        
+        # Clear the display, including the velocity colorbar
+        if self.velocity_colorbar is not None:
+            self.velocity_colorbar.remove()
+            self.velocity_colorbar = None
+        self.display_manager.clear()
+        self.canvas.draw_idle()
     
     def reset_interpolation(self):
         """Reset the interpolation results and return to input data view."""
@@ -728,10 +997,7 @@ class InterpolateTab(QWidget):
         # Restore original display
         self._display_velocity_data()
         
-        # Update UI state
-        self.reset_button.setEnabled(False)
-        self.save_txt_button.setEnabled(False)
-        self.save_bin_button.setEnabled(False)
+        self._set_result_buttons_enabled(False)
         
         info_message(self.console, "Interpolation results reset")
     
@@ -796,11 +1062,9 @@ class InterpolateTab(QWidget):
         else:
             output_dir = vels_dir
         
-        # Create the directory structure if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Create a simple config object with the needed path
-        config = type('SimpleConfig', (), {'vels_dir': output_dir})
+        # Simple config object with the needed path; the export functions
+        # create the directory themselves
+        config = SimpleNamespace(vels_dir=output_dir)
         
         # Get SEGY file path from velocity data
         segy_file_path = self.velocity_data.get('segy_file_path', "")
@@ -810,34 +1074,62 @@ class InterpolateTab(QWidget):
         cdp_grid = self.interpolated_data.get('vel_traces_grid') 
         twt_grid = self.interpolated_data.get('vel_twts_grid')
         
+        if format_type in self._export_tasks:
+            warning_message(self.console, f"The {format_type} file is already being saved")
+            return
+        
         try:
             if format_type == "text":
                 # Save as text file
-                result = save_velocity_text_data(config, segy_file_path, cdp_grid, twt_grid, vel_grid)
-                if result['success'] == True:
-                    success_message(self.console, f"Velocity data saved as text file to: {result['path']}")
-                else:
-                    error_message(self.console, f"Failed to save velocity text file: {result.get('error', 'Unknown error')}")
-            
+                from ..utils.velocity_export import save_velocity_text_data
+                compress = 'gzip' if self.compress_txt_checkbox.isChecked() else None
+                task = ExportTask(format_type, save_velocity_text_data,
+                                  config, segy_file_path, cdp_grid, twt_grid, vel_grid, compress)
             elif format_type == "binary":
                 # Save as binary file
-                result = save_velocity_binary_data(config, segy_file_path, vel_grid)
-                if result['success'] == True:
-                    success_message(self.console, f"Velocity data saved as binary file to: {result['path']}")
-                else:
-                    error_message(self.console, f"Failed to save velocity binary file: {result.get('error', 'Unknown error')}")
+                from ..utils.velocity_export import save_velocity_binary_data
+                task = ExportTask(format_type, save_velocity_binary_data,
+                                  config, segy_file_path, vel_grid)
+            else:
+                return
+            
+            # Write on a worker thread so the window stays responsive; the grids
+            # are read-only and replaced rather than mutated, so they can be
+            # shared with the worker as they are
+            task.signals.finished.connect(self._on_export_finished, Qt.QueuedConnection)
+            self._export_tasks[format_type] = task
+            info_message(self.console, f"Saving velocity data as {format_type} file...")
+            QThreadPool.globalInstance().start(task)
         
         except Exception as e:
             error_message(self.console, f"Error saving velocity data: {str(e)}")
             import traceback
             error_message(self.console, traceback.format_exc())                     
 
+    def _on_export_finished(self, format_type, result):
+        """Report the outcome of an export written on a worker thread."""
+        self._export_tasks.pop(format_type, None)
+        if result['success'] == True:
+            if result.get('note'):
+                info_message(self.console, result['note'])
+            success_message(self.console, f"Velocity data saved as {format_type} file to: {result['path']}")
+        else:
+            error_message(self.console, f"Failed to save velocity {format_type} file: {result.get('error', 'Unknown error')}")
+
     def _show_velocity_distribution(self):
         """Show velocity distribution in a separate window."""
         if self.velocity_data is None:
             warning_message(self.console, "No velocity data available to display")
             return
         
+        # Results and pick sets are replaced rather than mutated, so the same
+        # object means the window already shows this data
+        source = self.interpolated_data if self.interpolated_data is not None else self.velocity_data
+        if self.vel_dist_window is not None and source is self._dist_plot_source:
+            self.vel_dist_window.show()
+            self.vel_dist_window.raise_()
+            return
+        
         try:
             # Determine which velocity data to use
             if self.interpolated_data is not None:
@@ -853,10 +1145,11 @@ class InterpolateTab(QWidget):
                     grid_shape = self.interpolated_data['vel_values_grid'].shape
                     sample_factor = max(1, grid_shape[0] * grid_shape[1] // 5000)  # Limit to ~5000 points
                     
-                    # Sample the grid at regular intervals
-                    trace_grid_flat = self.interpolated_data['vel_traces_grid'].flatten()[::sample_factor]
-                    twt_grid_flat = self.interpolated_data['vel_twts_grid'].flatten()[::sample_factor]
-                    vel_grid_flat = self.interpolated_data['vel_values_grid'].flatten()[::sample_factor]
+                    # Sample the grid at regular intervals; flat indexing gathers only
+                    # the sampled points, even from the broadcast coordinate grids
+                    trace_grid_flat = self.interpolated_data['vel_traces_grid'].flat[::sample_factor]
+                    twt_grid_flat = self.interpolated_data['vel_twts_grid'].flat[::sample_factor]
+                    vel_grid_flat = self.interpolated_data['vel_values_grid'].flat[::sample_factor]
                     
                     vel_traces = trace_grid_flat
                     vel_twts = twt_grid_flat
@@ -867,12 +1160,11 @@ class InterpolateTab(QWidget):
                     vel_twts = self.interpolated_data.get('vel_twts', [])
                     vel_values = self.interpolated_data.get('vel_values', [])
                 
-                # Get regression parameters if available
+                # Reuse the fitted model parameters instead of refitting
                 regression_params = {}
-                if 'linear_params' in self.interpolated_data:
-                    regression_params['linear'] = self.interpolated_data['linear_params']
-                if 'log_params' in self.interpolated_data:
-                    regression_params['logarithmic'] = self.interpolated_data['log_params']
+                model_params = self.interpolated_data.get('model_params', {})
+                if model_params.get('type') in ('linear', 'logarithmic'):
+                    regression_params[model_params['type']] = model_params
 
             else:
                 # Show distribution for the original input data
@@ -900,6 +1192,7 @@ class InterpolateTab(QWidget):
                 console=self.console,
                 regression_params=regression_params
             )
+            self._dist_plot_source = source
             
             if self.console:
                 info_message(self.console, f"Velocity distribution window displayed for {title_suffix}")
@@ -210,7 +210,8 @@ class FirstRunDialog(QDialog):
         directory = QFileDialog.getExistingDirectory(
             self, 
             "Select Directory for VelRecover Data",
-            os.path.expanduser("~")
+            os.path.expanduser("~"),
+            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
         )
         
         if directory:
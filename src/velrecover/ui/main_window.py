@@ -1,29 +1,30 @@
 """Main window for VelRecover application."""
 import matplotlib
-matplotlib.use('QtAgg')
+# The canvases are created as QtAgg widgets explicitly and pyplot is only used
+# for colormaps, so a session without a display keeps the Agg backend rather
+# than failing to import
+matplotlib.use('QtAgg', force=False)
 import os
+import sys
 import json
-import subprocess
-from PySide6.QtGui import QFont, QAction
-from PySide6.QtCore import Qt
+import time
+from functools import lru_cache
+from PySide6.QtGui import QAction, QTextCursor
+from PySide6.QtCore import Qt, QTimer, QEventLoop, Slot, Signal, QObject, QRunnable, QThreadPool
 from PySide6.QtWidgets import (
-    QApplication, QStatusBar, QProgressBar, QVBoxLayout, QLabel, 
-    QPushButton, QMessageBox, QWidget, QTextEdit, QStyle, QDialog, 
-    QFileDialog, QMainWindow, QSplitter, QHBoxLayout
+    QApplication, QStatusBar, QProgressBar, 
+    QPushButton, QMessageBox, QWidget, QPlainTextEdit, QStyle, QDialog, 
+    QFileDialog, QMainWindow, QHBoxLayout
 )
 
-import appdirs
-
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
-
 # Import the dialogs and resource utilities
 from .help_dialogs import AboutDialog, FirstRunDialog
-from ..utils.resource_utils import copy_tutorial_files
+from ..utils.resource_utils import copy_file_if_changed, copy_tutorial_files, std_icon
 from ..utils.console_utils import (
     section_header, success_message, error_message, 
     warning_message, info_message, progress_message,
-    summary_statistics, initialize_log_file, close_log_file
+    summary_statistics, initialize_log_file, close_log_file,
+    console_enabled, set_console_level, DEBUG, INFO
 )
 
 # Imports for the tabbed interface
@@ -34,9 +35,21 @@ from ._1_load_data_tab import LoadDataTab
 from ._2_edit_tab import EditTab
 from ._3_interpolate_tab import InterpolateTab
 
+@lru_cache(maxsize=None)
+def _user_dirs(app_name):
+    """Return the (data, config) directories for app_name, resolved once per process."""
+    # appdirs is only needed here, so it is imported on first use
+    import appdirs
+    return appdirs.user_data_dir(app_name), appdirs.user_config_dir(app_name)
+
 class ProgressStatusBar(QStatusBar):
     """Status bar with integrated progress bar."""
 
+    # Minimum time between event loop passes while updating progress
+    UPDATE_INTERVAL = 0.1
+    # Every Nth pass also delivers user input so Cancel stays clickable
+    INPUT_POLL_EVERY = 5
+
     def __init__(self, parent=None):
         """Initialize the progress status bar.""" 
         super().__init__(parent)
@@ -52,18 +65,26 @@ class ProgressStatusBar(QStatusBar):
         # Create cancel button
         self.cancel_button = QPushButton()
         self.cancel_button.setObjectName("cancel_button")
-        self.cancel_button.setIcon(self.style().standardIcon(QStyle.SP_DialogCancelButton))
+        self.cancel_button.setIcon(std_icon(self, QStyle.SP_DialogCancelButton))
         self.cancel_button.setVisible(False)
-        self.cancel_button.clicked.connect(self.cancel)
+        self.cancel_button.clicked.connect(self.cancel, Qt.DirectConnection)
         
         # Add widgets to status bar
         self.addPermanentWidget(self.progress_bar)
         self.addPermanentWidget(self.cancel_button)
         
         self._canceled = False
+        self._last_value = None
+        self._last_message = None
+        self._last_refresh = 0.0
+        self._refresh_count = 0
         
     def start(self, title, maximum):
         self._canceled = False
+        self._last_value = 0
+        self._last_message = title
+        self._last_refresh = time.monotonic()
+        self._refresh_count = 0
         self.showMessage(title)
         self.progress_bar.setMaximum(maximum)
         self.progress_bar.setValue(0)
@@ -72,10 +93,28 @@ class ProgressStatusBar(QStatusBar):
         QApplication.processEvents()
         
     def update(self, value, message=None):
-        if message:
+        """Update progress, skipping ticks that would not change the display."""
+        value = int(value)
+        if value == self._last_value and (not message or message == self._last_message):
+            return
+        
+        if message and message != self._last_message:
             self.showMessage(message)
-        self.progress_bar.setValue(value)
-        QApplication.processEvents()
+            self._last_message = message
+        if value != self._last_value:
+            self.progress_bar.setValue(value)
+            self._last_value = value
+        
+        # Only pump the event loop every UPDATE_INTERVAL, and always at completion
+        now = time.monotonic()
+        if value >= self.progress_bar.maximum() or now - self._last_refresh >= self.UPDATE_INTERVAL:
+            self._last_refresh = now
+            self._refresh_count += 1
+            if self._refresh_count % self.INPUT_POLL_EVERY == 0:
+                QApplication.processEvents()
+            else:
+                # Repaint only; skip input dispatch on intermediate passes
+                QApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
         
     def finish(self):
         self.clearMessage()
@@ -86,10 +125,151 @@ class ProgressStatusBar(QStatusBar):
         """Check if the operation was canceled."""
         return self._canceled
     
+    @Slot()
     def cancel(self):
         """Cancel the current operation."""
         self._canceled = True
 
+class CopyDataSignals(QObject):
+    """Signals emitted by a CopyDataTask."""
+    
+    progress = Signal(str)  # Last file copied, relative to the source directory
+    finished = Signal(str)  # Error message, empty on success
+
+class CopyDataTask(QRunnable):
+    """Copy the SEGY and VELS folders between data directories off the GUI thread."""
+    
+    # Minimum time between progress reports, so small files don't flood the GUI
+    PROGRESS_INTERVAL = 0.033
+    # Number of files copied concurrently
+    COPY_WORKERS = 4
+    
+    def __init__(self, source_dir, target_dir):
+        super().__init__()
+        self.source_dir = source_dir
+        self.target_dir = target_dir
+        self.signals = CopyDataSignals()
+    
+    def run(self):
+        """Copy all files and subfolders, then report completion."""
+        import shutil
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        last_report = 0.0
+        report_lock = threading.Lock()
+        
+        def report_copied(src):
+            # Called by the copy workers as each file finishes
+            nonlocal last_report
+            now = time.monotonic()
+            with report_lock:
+                if now - last_report < self.PROGRESS_INTERVAL:
+                    return
+                last_report = now
+            self.signals.progress.emit(os.path.relpath(src, self.source_dir))
+        
+        try:
+            # File copies are I/O bound and release the GIL, so a few run in
+            # parallel while this thread keeps walking the folders
+            with ThreadPoolExecutor(max_workers=self.COPY_WORKERS) as pool:
+                pending = []
+                
+                def submit_copy(src, dst):
+                    future = pool.submit(copy_file_if_changed, src, dst)
+                    future.add_done_callback(lambda _: report_copied(src))
+                    pending.append(future)
+                
+                folders = ['SEGY', 'VELS']
+                for folder in folders:
+                    src_folder = os.path.join(self.source_dir, folder)
+                    dst_folder = os.path.join(self.target_dir, folder)
+                    
+                    if os.path.exists(src_folder):
+                        # Create target folder if it doesn't exist
+                        os.makedirs(dst_folder, exist_ok=True)
+                        
+                        # Copy all files from source to target; scandir entries carry
+                        # their file type, so no extra stat per item is needed
+                        with os.scandir(src_folder) as entries:
+                            for entry in entries:
+                                dst_item = os.path.join(dst_folder, entry.name)
+                                if entry.is_file():
+                                    # copy2 uses the kernel's zero-copy path (sendfile) where
+                                    # available; files already copied unchanged are skipped
+                                    submit_copy(entry.path, dst_item)
+                                elif entry.is_dir():
+                                    # copytree creates the folders, the pool copies the files
+                                    shutil.copytree(entry.path, dst_item, copy_function=submit_copy,
+                                                    dirs_exist_ok=True)
+                
+                # Wait for every copy, re-raising the first failure
+                for future in pending:
+                    future.result()
+        except Exception as e:
+            self.signals.finished.emit(str(e))
+            return
+        
+        self.signals.finished.emit("")
+
+class BufferedConsole(QPlainTextEdit):
+    """Read-only plain-text console that coalesces appended lines into periodic flushes."""
+
+    FLUSH_INTERVAL_MS = 50
+    MAX_BLOCKS = 5000
+
+    def __init__(self, parent=None):
+        """Initialize the console and its flush timer."""
+        super().__init__(parent)
+        self._pending = []
+
+        # Single-shot timer restarted by the first append after each flush
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+        # Keep memory and relayout bounded for long sessions
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(self.MAX_BLOCKS)
+
+    def append(self, text):
+        """Queue a line of text to be written on the next flush."""
+        self._pending.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    @Slot()
+    def flush(self):
+        """Write all queued lines to the document in a single append."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+
+        text = "\n".join(self._pending)
+        self._pending.clear()
+
+        # Insert the whole batch as one edit block at the end of the document,
+        # following the output only when the view was already at the bottom
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.End)
+        self.setUpdatesEnabled(False)
+        cursor.beginEditBlock()
+        if not self.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(text)
+        cursor.endEditBlock()
+        self.setUpdatesEnabled(True)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def clear(self):
+        """Discard queued lines and clear the document."""
+        self._flush_timer.stop()
+        self._pending.clear()
+        super().clear()
+
 class VelRecover(QMainWindow):
     """Main application widget for VelRecover."""
     
@@ -100,13 +280,15 @@ class VelRecover(QMainWindow):
         # Make window dimensions consistent with bigger size for the tabbed UI
         self.setMinimumSize(1200, 800)
         
+        # Console is created after the config is loaded; messages before then are
+        # queued and replayed into it once it exists
+        self.console = None
+        self._early_console_lines = []
+        
         # Get appropriate directories for user data and config
         self.app_name = "VelRecover"
-        self.user_data_dir = appdirs.user_data_dir(self.app_name)
-        self.user_config_dir = appdirs.user_config_dir(self.app_name)
+        self.user_data_dir, self.user_config_dir = _user_dirs(self.app_name)
         
-        # Ensure config directory exists
-        os.makedirs(self.user_config_dir, exist_ok=True)
         self.config_path = os.path.join(self.user_config_dir, 'config.json')
         
         self.load_config()
@@ -115,8 +297,6 @@ class VelRecover(QMainWindow):
         self.velocity_data = None
         self.velocity_file_path = None
         self.interpolated_data = None
-        
-        self.create_required_folders()
 
         # Initialize the central widget with a horizontal layout
         self.central_widget = QWidget()
@@ -149,14 +329,19 @@ class VelRecover(QMainWindow):
         content_layout.addWidget(self.tab_container, 1)  # 1 = stretch factor
         
         # Create and add console
-        self.console = QTextEdit()
+        self.console = BufferedConsole()
         self.console.setObjectName("console")  
         self.console.setReadOnly(True)
-        self.console.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+        self.console.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
         self.console.setMinimumWidth(300)
         self.console.setMaximumWidth(400)
         content_layout.addWidget(self.console)
         
+        # Replay messages produced while loading the configuration
+        if self._early_console_lines:
+            self.console.append("\n".join(self._early_console_lines))
+            self._early_console_lines = []
+        
         # Add content container to main layout
         main_layout.addWidget(content_container, 1)  # 1 = stretch factor
         
@@ -185,6 +370,7 @@ class VelRecover(QMainWindow):
         # Disable tabs that require prior steps
         self.navigation_panel.enable_tabs_until("welcome")
     
+    @Slot(str)
     def handle_navigation_change(self, identifier):
         """Handle navigation changes from the side panel."""
         self.tab_container.switch_to(identifier)
@@ -214,8 +400,13 @@ class VelRecover(QMainWindow):
         interpolate_tab.proceedRequested.connect(lambda: self.proceed_to_tab("save"))
         self.tab_container.add_tab("interpolate", interpolate_tab)
         
+        # SEGY files that cannot be mapped are read with progress in the status bar
+        for tab in (load_data_tab, edit_tab, interpolate_tab):
+            tab.display_manager.progress = self.progress
+        
 
     
+    @Slot()
     def start_new_velocity_field(self):
         """Start a new velocity field processing workflow."""
         # Reset state
@@ -223,21 +414,27 @@ class VelRecover(QMainWindow):
         self.velocity_file_path = None
         self.interpolated_data = None
         
-        # Reset all tabs
-        for tab_id in ["load_data", "edit", "interpolate"]:
-            widget = self.tab_container.widget(self.tab_container.tab_indices[tab_id])
-            if hasattr(widget, "reset"):
-                widget.reset()
-        
-        # Switch to load data tab and enable only this step
-        self.proceed_to_tab("load_data")
-        self.navigation_panel.enable_tabs_until("load_data")
-        
-        # Clear console and show message
-        self.console.clear()
-        section_header(self.console, "New Velocity Field")
-        info_message(self.console, "Starting new velocity field workflow")
-        info_message(self.console, "Please load velocity data")
+        # Suspend repaints so the tab resets and button state changes below
+        # are drawn in a single pass
+        self.setUpdatesEnabled(False)
+        try:
+            # Reset all tabs
+            for tab_id in ["load_data", "edit", "interpolate"]:
+                widget = self.tab_container.widget(self.tab_container.tab_indices[tab_id])
+                if hasattr(widget, "reset"):
+                    widget.reset()
+            
+            # Switch to load data tab and enable only this step
+            self.proceed_to_tab("load_data")
+            self.navigation_panel.enable_tabs_until("load_data")
+            
+            # Clear console and show message
+            self.console.clear()
+            section_header(self.console, "New Velocity Field")
+            info_message(self.console, "Starting new velocity field workflow")
+            info_message(self.console, "Please load velocity data")
+        finally:
+            self.setUpdatesEnabled(True)
     
     def proceed_to_tab(self, tab_id):
         """Switch to specified tab and update navigation."""
@@ -263,6 +460,7 @@ class VelRecover(QMainWindow):
             if hasattr(save_tab, "update_with_data"):
                 save_tab.update_with_data(self.interpolated_data)
     
+    @Slot(str, object)
     def handle_data_loaded(self, file_path, data):
         """Handle signal from LoadDataTab when data is loaded."""
         self.velocity_file_path = file_path
@@ -274,6 +472,7 @@ class VelRecover(QMainWindow):
         # Enable navigation to next step
         self.navigation_panel.enable_tabs_until("edit")
     
+    @Slot(object)
     def handle_editing_completed(self, edited_data):
         """Handle signal from EditTab when editing is complete."""
         self.velocity_data = edited_data
@@ -284,6 +483,7 @@ class VelRecover(QMainWindow):
         # Enable navigation to next step
         self.navigation_panel.enable_tabs_until("interpolate")
     
+    @Slot(dict)
     def handle_interpolation_completed(self, interpolated_data):
         """Handle signal from InterpolateTab when interpolation is complete."""
         self.interpolated_data = interpolated_data
@@ -296,7 +496,7 @@ class VelRecover(QMainWindow):
     
     
     def create_menu_bar(self):
-        """Create the menu bar with file and help menus."""
+        """Create the menu bar with file, view and help menus."""
         menu_bar = self.menuBar()
         menu_bar.setObjectName("menu_bar")
         
@@ -305,14 +505,14 @@ class VelRecover(QMainWindow):
         
         # Set directory action
         set_dir_action = QAction("Set Data Directory", self)
-        set_dir_action.setIcon(self.style().standardIcon(QStyle.SP_DirIcon))
+        set_dir_action.setIcon(std_icon(self, QStyle.SP_DirIcon))
         set_dir_action.setShortcut("Ctrl+D")
         set_dir_action.triggered.connect(self.set_base_directory)
         file_menu.addAction(set_dir_action)
         
         # Open directory action
         open_dir_action = QAction("Open Data Directory", self)
-        open_dir_action.setIcon(self.style().standardIcon(QStyle.SP_DirOpenIcon))
+        open_dir_action.setIcon(std_icon(self, QStyle.SP_DirOpenIcon))
         open_dir_action.setShortcut("Ctrl+O")
         open_dir_action.triggered.connect(self.open_work_directory)
         file_menu.addAction(open_dir_action)
@@ -323,15 +523,33 @@ class VelRecover(QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
         
+        # View menu
+        view_menu = menu_bar.addMenu("View")
+        
+        # Verbose console action; shows the diagnostic messages of every redraw
+        verbose_action = QAction("Verbose Console Output", self)
+        verbose_action.setCheckable(True)
+        verbose_action.setChecked(console_enabled(DEBUG))
+        verbose_action.toggled.connect(self.set_verbose_console)
+        view_menu.addAction(verbose_action)
+        
         # Help menu
         help_menu = menu_bar.addMenu("Help")
         
         # About action
         about_action = QAction("About", self)
-        about_action.setIcon(self.style().standardIcon(QStyle.SP_MessageBoxInformation))
+        about_action.setIcon(std_icon(self, QStyle.SP_MessageBoxInformation))
         about_action.triggered.connect(self.show_about_dialog)
         help_menu.addAction(about_action)
 
+    @Slot(bool)
+    def set_verbose_console(self, verbose):
+        """Show or hide the diagnostic console messages and remember the choice."""
+        set_console_level(DEBUG if verbose else INFO)
+        self.save_config()
+        info_message(self.console, f"Verbose console output {'enabled' if verbose else 'disabled'}")
+
+    @Slot()
     def open_work_directory(self):
         """Open the current work directory in the file explorer."""
         try:
@@ -339,6 +557,7 @@ class VelRecover(QMainWindow):
                 if os.name == 'nt':  # Windows
                     os.startfile(self.work_dir)
                 elif os.name == 'posix':  # macOS and Linux
+                    import subprocess
                     if os.uname().sysname == 'Darwin':  # macOS
                         subprocess.run(['open', self.work_dir])
                     else:  # Linux
@@ -361,6 +580,9 @@ class VelRecover(QMainWindow):
         is_first_run = not os.path.exists(self.config_path)
         
         if is_first_run:
+            # Ensure config directory exists; afterwards the config file proves it does
+            os.makedirs(self.user_config_dir, exist_ok=True)
+            
             # Show first run dialog
             dialog = FirstRunDialog(self, default_base_dir)
             result = dialog.exec()
@@ -383,14 +605,17 @@ class VelRecover(QMainWindow):
                 base_dir = default_base_dir
                 config = {'base_dir': base_dir}
                 print(f"Error loading config: {e}")
+        
+        # Diagnostic messages are only shown when verbose output was chosen
+        set_console_level(DEBUG if config.get('verbose_console', False) else INFO)
             
-        # Set work_dir to base_dir
+        # Set work_dir to base_dir; normalized so path comparisons are exact, and
+        # interned since every tab and dialog path is derived from it
+        base_dir = sys.intern(os.path.normpath(base_dir))
         self.base_dir = base_dir
         self.work_dir = base_dir
         
-        # Create base directory if it doesn't exist
-        os.makedirs(self.base_dir, exist_ok=True)
-        
+        # Create the base directory and folder tree
         self.create_required_folders()
         
         # Copy example files from the installed package to the user's data directory on first run
@@ -407,28 +632,30 @@ class VelRecover(QMainWindow):
     def save_config(self):
         """Save configuration to file."""
         config = {
-            'base_dir': self.base_dir
+            'base_dir': self.base_dir,
+            'verbose_console': console_enabled(DEBUG)
         }
         try:
-            # Ensure the config directory exists
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
             with open(self.config_path, 'w') as f:
                 json.dump(config, f)
         except Exception as e:
-            if hasattr(self, 'console'):
+            if self.console is not None:
                 self.console.append(f"Error saving configuration: {str(e)}")
             else:
                 print(f"Error saving configuration: {str(e)}")
              
+    @Slot()
     def set_base_directory(self):
         """Let the user choose the base directory for data storage."""
         directory = QFileDialog.getExistingDirectory(
             self, 
             "Select Base Directory for Data Storage",
-            self.base_dir
+            self.base_dir,
+            QFileDialog.ShowDirsOnly | QFileDialog.DontResolveSymlinks
         )
         
         if directory:
+            directory = sys.intern(os.path.normpath(directory))
             old_work_dir = self.work_dir
             self.base_dir = directory
             self.work_dir = directory
@@ -440,8 +667,19 @@ class VelRecover(QMainWindow):
             # Create required folders in new directory
             self.create_required_folders()
                 
+            # Nothing to offer if the previous directory is missing or empty
+            try:
+                with os.scandir(old_work_dir) as entries:
+                    has_content = any(True for _ in entries)
+            except OSError:
+                has_content = False
+            
+            # Copying into a folder nested inside the source is not supported
+            old_prefix = os.path.join(os.path.abspath(old_work_dir), "")
+            is_nested = os.path.abspath(self.work_dir).startswith(old_prefix)
+            
             # Ask if user wants to copy existing data if we had a previous directory
-            if os.path.exists(old_work_dir) and old_work_dir != self.work_dir:
+            if old_work_dir != self.work_dir and has_content and not is_nested:
                 reply = QMessageBox.question(
                     self, 
                     "Copy Existing Data",
@@ -453,32 +691,33 @@ class VelRecover(QMainWindow):
                     self.copy_data(old_work_dir, self.work_dir)
 
     def copy_data(self, source_dir, target_dir):
-        """Copy data from old directory to new directory."""
-        import shutil
-        try:
-            folders = ['SEGY', 'VELS']
-            for folder in folders:
-                src_folder = os.path.join(source_dir, folder)
-                dst_folder = os.path.join(target_dir, folder)
-                
-                if os.path.exists(src_folder):
-                    # Create target folder if it doesn't exist
-                    os.makedirs(dst_folder, exist_ok=True)
-                    
-                    # Copy all files from source to target
-                    for item in os.listdir(src_folder):
-                        src_item = os.path.join(src_folder, item)
-                        dst_item = os.path.join(dst_folder, item)
-                        if os.path.isfile(src_item):
-                            shutil.copy2(src_item, dst_item)
-                        elif os.path.isdir(src_item):
-                            shutil.copytree(src_item, dst_item, dirs_exist_ok=True)
-            
+        """Copy data from old directory to new directory on a worker thread."""
+        self.progress.start("Copying data to new location...", 0)
+        
+        # Keep a reference so the task's signals outlive the worker
+        self._copy_task = CopyDataTask(source_dir, target_dir)
+        self._copy_task.signals.progress.connect(self._on_copy_progress, Qt.QueuedConnection)
+        self._copy_task.signals.finished.connect(self._on_copy_finished, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(self._copy_task)
+    
+    @Slot(str)
+    def _on_copy_progress(self, name):
+        """Show the file copied most recently."""
+        self.progress.showMessage(f"Copied {name}")
+    
+    @Slot(str)
+    def _on_copy_finished(self, error):
+        """Report the result of a background data copy."""
+        self.progress.finish()
+        self._copy_task = None
+        
+        if error:
+            self.console.append(f"Error copying data: {error}")
+            QMessageBox.warning(self, "Copy Error", f"Error copying data: {error}")
+        else:
             self.console.append("Data copied successfully to new location")
-        except Exception as e:
-            self.console.append(f"Error copying data: {str(e)}")
-            QMessageBox.warning(self, "Copy Error", f"Error copying data: {str(e)}")
-
+    
+    @Slot()
     def show_about_dialog(self):
         """Show the About dialog."""
         about_dialog = AboutDialog(self)
@@ -493,21 +732,28 @@ class VelRecover(QMainWindow):
             'VELS/RAW', 
             'VELS/INTERPOLATED/TXT',
             'VELS/INTERPOLATED/BIN', 
-            'VELS/CUSTOM'
+            'VELS/CUSTOM',
+            'LOG'
         ]
         
-        # Create each folder in the script directory
+        # Create each folder in the script directory, collecting console lines
+        lines = []
         for folder in required_folders:
             folder_path = os.path.join(self.work_dir, folder)
             try:
                 os.makedirs(folder_path, exist_ok=True)
-                if hasattr(self, 'console'):
-                    self.console.append(f"Folder created: {folder_path}")
+                lines.append(f"Folder created: {folder_path}")
             except Exception as e:
-                if hasattr(self, 'console'):
-                    self.console.append(f"Error creating folder {folder_path}: {str(e)}")
-                else:
+                lines.append(f"Error creating folder {folder_path}: {str(e)}")
+                if self.console is None:
                     print(f"Error creating folder {folder_path}: {str(e)}")
+        
+        # Report all folders with a single console write
+        if lines:
+            if self.console is not None:
+                self.console.append("\n".join(lines))
+            else:
+                self._early_console_lines.extend(lines)
 
     def closeEvent(self, event):
         """Handle application close event."""
@@ -7,6 +7,8 @@ from PySide6.QtWidgets import (
     QFrame, QSizePolicy, QStyle
 )
 
+from ..utils.resource_utils import std_icon
+
 class NavButton(QPushButton):
     """Custom navigation button for sidebar."""
     
@@ -22,7 +24,7 @@ class NavButton(QPushButton):
         
         # Set icon if provided
         if (icon_name):
-            self.setIcon(self.style().standardIcon(icon_name))
+            self.setIcon(std_icon(self, icon_name))
         
         # Configure button for smaller screens
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
@@ -4,8 +4,9 @@
 from .console_utils import (
     section_header, success_message, error_message, 
     warning_message, info_message, progress_message,
-    summary_statistics, initialize_log_file, close_log_file
+    summary_statistics, initialize_log_file, close_log_file,
+    console_enabled, set_console_level, DEBUG, INFO
 )
 
 # Import resource utilities
-from .resource_utils import copy_tutorial_files
\ No newline at end of file
+from .resource_utils import copy_file_if_changed, copy_tutorial_files, std_icon
\ No newline at end of file
@@ -6,6 +6,25 @@ import os
 # Global log file handle
 log_file = None
 
+# Log file buffer size; lines are flushed in blocks rather than one by one
+LOG_BUFFER_SIZE = 65536
+
+# Console verbosity levels
+DEBUG = 10
+INFO = 20
+
+# Messages below this level are skipped before they are formatted
+console_level = INFO
+
+def set_console_level(level):
+    """Set the minimum level of messages written to the console."""
+    global console_level
+    console_level = level
+
+def console_enabled(level):
+    """Return True if messages at the given level are written to the console."""
+    return level >= console_level
+
 def initialize_log_file(work_dir):
     """Initialize the log file for the current session."""
     global log_file
@@ -13,13 +32,17 @@ def initialize_log_file(work_dir):
     # Create a timestamped filename for the log
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     log_dir = os.path.join(work_dir, "LOG")
-    os.makedirs(log_dir, exist_ok=True)
-    
     log_filename = f"velrecover_{timestamp}.log"
     log_path = os.path.join(log_dir, log_filename)
     
     try:
-        log_file = open(log_path, 'w', encoding='utf-8')
+        # The LOG folder is normally created with the rest of the data tree;
+        # only create it here if it is missing
+        try:
+            log_file = open(log_path, 'w', encoding='utf-8', buffering=LOG_BUFFER_SIZE)
+        except FileNotFoundError:
+            os.makedirs(log_dir, exist_ok=True)
+            log_file = open(log_path, 'w', encoding='utf-8', buffering=LOG_BUFFER_SIZE)
         log_file.write(f"VelRecover Log - Session started at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         log_file.write(f"Working directory: {work_dir}\n\n")
         log_file.flush()
@@ -35,13 +58,14 @@ def close_log_file():
         log_file.write(f"\nSession ended at {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         log_file.close()
 
-def _write_to_log(message):
-    """Write a message to the log file."""
+def _write_to_log(message, flush=False):
+    """Write a message to the log file, flushing only when requested."""
     global log_file
     if log_file and not log_file.closed:
         try:
             log_file.write(f"{message}\n")
-            log_file.flush()  # Ensure immediate write to file
+            if flush:
+                log_file.flush()
         except Exception as e:
             print(f"Error writing to log file: {e}")
 
@@ -65,7 +89,7 @@ def error_message(console, message):
     """Print an error message."""
     formatted = f"\n❌ ERROR: {message}"
     console.append(formatted)
-    _write_to_log(formatted)
+    _write_to_log(formatted, flush=True)  # Don't lose errors if the app crashes
     
 def warning_message(console, message):
     """Print a warning message."""
@@ -90,14 +114,11 @@ def progress_message(console, step, total, message):
         
 def summary_statistics(console, stats_dict):
     """Print summary statistics."""
-    header = f"\nSUMMARY STATISTICS"
-    console.append(header)
-    _write_to_log(header)
-    
-    for key, value in stats_dict.items():
-        item = f" • {key}: {value}"
-        console.append(item)
-        _write_to_log(item)
+    # Build the whole block first so the console and log get a single write
+    lines = ["\nSUMMARY STATISTICS"]
+    lines.extend(f" • {key}: {value}" for key, value in stats_dict.items())
+    lines.append("")  # Empty line after statistics
     
-    console.append("")  # Empty line after statistics
-    _write_to_log("")
\ No newline at end of file
+    block = "\n".join(lines)
+    console.append(block)
+    _write_to_log(block)
\ No newline at end of file
@@ -2,6 +2,48 @@
 import os
 import shutil
 import importlib.resources
+from concurrent.futures import ThreadPoolExecutor
+
+# Files copied at once when installing the tutorial data
+COPY_WORKERS = 4
+
+# Process-wide cache of QStyle standard icons
+_ICON_CACHE = {}
+
+def std_icon(widget, standard_pixmap):
+    """
+    Return a QStyle standard icon, looking it up only once per process.
+    
+    Args:
+        widget (QWidget): Widget whose style provides the icon
+        standard_pixmap (QStyle.StandardPixmap): Icon to retrieve
+    """
+    icon = _ICON_CACHE.get(standard_pixmap)
+    if icon is None:
+        icon = widget.style().standardIcon(standard_pixmap)
+        _ICON_CACHE[standard_pixmap] = icon
+    return icon
+
+def copy_file_if_changed(src, dst):
+    """
+    Copy a file with its metadata unless dst already holds the same copy.
+    
+    Args:
+        src (str): Source file path
+        dst (str): Destination file path
+    """
+    # copy2 carries the modification time over, so a destination with the
+    # same size and mtime is a copy from an earlier run and is left alone
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        if (src_stat.st_size == dst_stat.st_size
+                and src_stat.st_mtime_ns == dst_stat.st_mtime_ns):
+            return dst
+    return shutil.copy2(src, dst)
 
 def copy_tutorial_files(base_dir):
     """
@@ -21,20 +63,28 @@ def copy_tutorial_files(base_dir):
             tutorial_dir = str(tutorial_path)
         
         if os.path.exists(tutorial_dir):
-            for folder in ["SEGY", "VELS", "VELS/2D", "VELS/RAW"]:
-                src_folder = os.path.join(tutorial_dir, folder)
-                dst_folder = os.path.join(base_dir, folder)
-                
-                if os.path.exists(src_folder):
-                    # Create destination folder if it doesn't exist
-                    os.makedirs(dst_folder, exist_ok=True)
+            # Copies are I/O bound and release the GIL, so they overlap in a
+            # small pool while the folders are walked
+            with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+                pending = []
+                for folder in ["SEGY", "VELS", "VELS/2D", "VELS/RAW"]:
+                    src_folder = os.path.join(tutorial_dir, folder)
+                    dst_folder = os.path.join(base_dir, folder)
                     
-                    # Copy files from source folder to destination folder
-                    for file in os.listdir(src_folder):
-                        src_path = os.path.join(src_folder, file)
-                        dst_path = os.path.join(dst_folder, file)
-                        if os.path.isfile(src_path):
-                            shutil.copy2(src_path, dst_path)
+                    if os.path.exists(src_folder):
+                        # Create destination folder if it doesn't exist
+                        os.makedirs(dst_folder, exist_ok=True)
+                        
+                        # Copy files from source folder to destination folder
+                        with os.scandir(src_folder) as entries:
+                            for entry in entries:
+                                if entry.is_file():
+                                    pending.append(pool.submit(
+                                        copy_file_if_changed, entry.path, os.path.join(dst_folder, entry.name)))
+                
+                # Wait for every copy, re-raising the first failure
+                for future in pending:
+                    future.result()
                             
             print(f"Tutorial files copied successfully from {tutorial_dir}")
         else:
@@ -2,10 +2,9 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QApplication
 from PySide6.QtCore import Qt
-from scipy import stats
-from scipy.optimize import curve_fit
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
@@ -18,7 +17,7 @@ class VelScatterCanvas(FigureCanvas):
     def __init__(self, parent=None, fc='none'):
         """Initialize canvas with a figure."""
         from matplotlib.figure import Figure
-        fig = Figure(facecolor=fc)
+        fig = Figure(facecolor=fc, constrained_layout=True)
         self.ax = fig.add_subplot(111)
         super().__init__(fig)
         self.setParent(parent)
@@ -63,11 +62,34 @@ class VelocityDistributionWindow(QDialog):
             info_message(self.console, "Velocity Distribution window initialized")
             info_message(self.console, f"Window dimensions: {window_width}x{window_height} at position ({pos_x}, {pos_y})")
 
+def _fit_line(x, y):
+    """Least-squares line y = a + b·x, returning (a, b, r²)."""
+    # Closed form from the centred sums; this is all the preview needs from a
+    # regression, and avoids importing scipy.stats for it
+    dx = x - x.mean()
+    dy = y - y.mean()
+    sxx = np.dot(dx, dx)
+    syy = np.dot(dy, dy)
+    if sxx == 0:
+        raise ValueError("Cannot fit a line when all x values are identical")
+    sxy = np.dot(dx, dy)
+    slope = sxy / sxx
+    r_squared = sxy * sxy / (sxx * syy) if syy else 0.0
+    return y.mean() - slope * x.mean(), slope, r_squared
+
 def plot_velocity_distribution(canvas, cdp, twt, vel, console=None, window_size=None, regression_params=None):
     """Plot velocity distribution in the given canvas."""
     if console:
         info_message(console, "Generating velocity distribution plot...")
     
+    # Work on one contiguous float array per field; callers pass lists, column
+    # views of the parsed file or strided samples of an interpolated grid
+    cdp, twt, vel = (np.ascontiguousarray(a, dtype=np.float64) for a in (cdp, twt, vel))
+    
+    # Value ranges used for the regression lines, axis limits and statistics
+    min_vel, max_vel = vel.min(), vel.max()
+    min_twt, max_twt = twt.min(), twt.max()
+    
     # Clear the figure completely to avoid artifacts
     canvas.figure.clear()
     canvas.ax = canvas.figure.add_subplot(111)
@@ -84,25 +106,28 @@ def plot_velocity_distribution(canvas, cdp, twt, vel, console=None, window_size=
 
     colors = np.hstack((colors, np.ones((len(unique_cdps), 1))))  
 
-    # Plot scatter for each CDP
-    for cdp_val, color in zip(unique_cdps, colors):
-        mask = cdp == cdp_val
-        velocities = vel[mask]
-        twts = twt[mask]
-        
-        # Plot the scatter points with connected lines
-        canvas.ax.plot(
-            velocities, 
-            twts, 
-            color=color, 
-            label=f'{int(cdp_val)}',
-            marker='.',  
-            markersize=8,
-            linestyle='-',  
-            linewidth=0.2,  
-            alpha=0.5,
-            zorder=10
-        )
+    # Plot the points of every CDP with connecting lines, as one line
+    # collection and one scatter instead of an artist per CDP
+    order = np.argsort(cdp, kind='stable')
+    cdp_index = np.searchsorted(unique_cdps, cdp[order])
+    splits = np.flatnonzero(np.diff(cdp_index)) + 1
+    points = np.column_stack((vel[order], twt[order]))
+    canvas.ax.add_collection(LineCollection(
+        np.split(points, splits),
+        colors=colors,
+        linewidths=0.2,
+        alpha=0.5,
+        zorder=10
+    ), autolim=False)
+    canvas.ax.scatter(
+        points[:, 0],
+        points[:, 1],
+        c=colors[cdp_index],
+        marker='.',
+        s=8 ** 2,
+        alpha=0.5,
+        zorder=10
+    )
 
     # Calculate regression parameters if not provided
     if regression_params is None:
@@ -114,34 +139,24 @@ def plot_velocity_distribution(canvas, cdp, twt, vel, console=None, window_size=
             # This means using vel as x and twt as y, then converting the parameters
             if len(twt) > 2:  # Need at least 3 points for meaningful regression
                 # First approach: Linear regression where V = v0 + k*TWT
-                slope, intercept, r_value, p_value, std_err = stats.linregress(twt, vel)
+                intercept, slope, r_squared = _fit_line(twt, vel)
                 
                 linear_params = {
                     'v0': intercept,
                     'k': slope,
-                    'r2': r_value**2
+                    'r2': r_squared
                 }
                 regression_params['linear'] = linear_params
                 
                 if console:
-                    info_message(console, f"Linear regression: V = {intercept:.1f} + {slope:.3f}·TWT (R²: {r_value**2:.3f})")
+                    info_message(console, f"Linear regression: V = {intercept:.1f} + {slope:.3f}·TWT (R²: {r_squared:.3f})")
             
             # Calculate logarithmic regression (V = v0 + k*ln(TWT))
-            if len(twt) > 2 and np.all(twt > 0):  # Need positive values for log
-                # Define logarithmic function: V = v0 + k*ln(TWT)
-                def log_func(x, v0, k):
-                    return v0 + k * np.log(x)
-                
-                # Fit the function to our data
+            if len(twt) > 2 and min_twt > 0:  # Need positive values for log
+                # The model is linear in v0 and k, so ordinary least squares on
+                # ln(TWT) gives the exact fit without an iterative optimizer
                 try:
-                    popt, pcov = curve_fit(log_func, twt, vel)
-                    v0, k = popt
-                    
-                    # Calculate R² for logarithmic fit
-                    residuals = vel - log_func(twt, v0, k)
-                    ss_res = np.sum(residuals**2)
-                    ss_tot = np.sum((vel - np.mean(vel))**2)
-                    r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
+                    v0, k, r_squared = _fit_line(np.log(twt), vel)
                     
                     log_params = {
                         'v0': v0,
@@ -152,7 +167,7 @@ def plot_velocity_distribution(canvas, cdp, twt, vel, console=None, window_size=
                     
                     if console:
                         info_message(console, f"Logarithmic regression: V = {v0:.1f} + {k:.1f}·ln(TWT) (R²: {r_squared:.3f})")
-                except:
+                except ValueError:
                     if console:
                         warning_message(console, "Could not fit logarithmic regression. Skipping.")
         except Exception as e:
@@ -162,9 +177,9 @@ def plot_velocity_distribution(canvas, cdp, twt, vel, console=None, window_size=
     # Add regression lines if parameters are available
     if regression_params:
         # Range for velocity values
-        vel_range = max(vel) - min(vel)
-        vel_min = min(vel) - vel_range * 0.05
-        vel_max = max(vel) + vel_range * 0.05
+        vel_range = max_vel - min_vel
+        vel_min = min_vel - vel_range * 0.05
+        vel_max = max_vel + vel_range * 0.05
         vel_points = np.linspace(vel_min, vel_max, 100)
         
         # Linear regression
@@ -177,7 +192,7 @@ def plot_velocity_distribution(canvas, cdp, twt, vel, console=None, window_size=
             # Calculate TWT values for each velocity point using the inverse of the linear model
             twt_linear = [(v - v0) / k if k != 0 else 0 for v in vel_points]
             
-            valid_mask = np.logical_and(np.array(twt_linear) >= 0, np.array(twt_linear) <= max(twt) * 1.1)
+            valid_mask = np.logical_and(np.array(twt_linear) >= 0, np.array(twt_linear) <= max_twt * 1.1)
             if np.any(valid_mask):
 
                 canvas.ax.plot(
@@ -191,7 +206,7 @@ def plot_velocity_distribution(canvas, cdp, twt, vel, console=None, window_size=
                 
                 # Add formula as text annotation
                 formula_text = f'Linear: V = {v0:.1f} + {k:.3f}·TWT (R²: {r2:.3f})'
-                canvas.ax.text(
+                formula_label = canvas.ax.text(
                     0.02, 0.02,  # Position at bottom left
                     formula_text,
                     transform=canvas.ax.transAxes,  # Use axis coordinates
@@ -199,6 +214,7 @@ def plot_velocity_distribution(canvas, cdp, twt, vel, console=None, window_size=
                     color='red',
                     bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', pad=3)
                 )
+                formula_label.set_in_layout(False)
 
         # Logarithmic regression
         if 'logarithmic' in regression_params:
@@ -210,7 +226,7 @@ def plot_velocity_distribution(canvas, cdp, twt, vel, console=None, window_size=
             # Calculate TWT values for each velocity point using the inverse of the logarithmic model
             twt_log = [np.exp((v - v0) / k) if k != 0 else 0 for v in vel_points]
             
-            valid_mask = np.logical_and(np.array(twt_log) >= 0, np.array(twt_log) <= max(twt) * 1.1)
+            valid_mask = np.logical_and(np.array(twt_log) >= 0, np.array(twt_log) <= max_twt * 1.1)
             if np.any(valid_mask):
 
                 canvas.ax.plot(
@@ -223,7 +239,7 @@ def plot_velocity_distribution(canvas, cdp, twt, vel, console=None, window_size=
                 )
                 
                 formula_text = f'Log: V = {v0:.1f} + {k:.1f}·ln(TWT) (R²: {r2:.3f})'
-                canvas.ax.text(
+                formula_label = canvas.ax.text(
                     0.02, 0.08,  
                     formula_text,
                     transform=canvas.ax.transAxes,  
@@ -231,6 +247,7 @@ def plot_velocity_distribution(canvas, cdp, twt, vel, console=None, window_size=
                     color='green',
                     bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', pad=3)
                 )
+                formula_label.set_in_layout(False)
 
     # Add moving average trend line 
     if len(vel) > 5:  # Only if we have sufficient data points
@@ -268,11 +285,11 @@ def plot_velocity_distribution(canvas, cdp, twt, vel, console=None, window_size=
     canvas.ax.set_ylabel('TWT (ms)', fontsize=10, fontweight='bold')
     canvas.ax.set_title('Velocity Distribution by CDP', fontsize=12, fontweight='bold')
 
-    vel_range = max(vel) - min(vel)
-    twt_range = max(twt) - min(twt)
+    vel_range = max_vel - min_vel
+    twt_range = max_twt - min_twt
     
-    canvas.ax.set_xlim(min(vel) - vel_range*0.05, max(vel) + vel_range*0.05)
-    canvas.ax.set_ylim(0, max(twt) * 1.05)
+    canvas.ax.set_xlim(min_vel - vel_range*0.05, max_vel + vel_range*0.05)
+    canvas.ax.set_ylim(0, max_twt * 1.05)
     canvas.ax.invert_yaxis()  
 
     handles, labels = [], []
@@ -283,27 +300,28 @@ def plot_velocity_distribution(canvas, cdp, twt, vel, console=None, window_size=
         labels.append(label)
     
     if handles:  # Only create legend if we have items
-        canvas.ax.legend(handles, labels, loc='upper left', 
-                        bbox_to_anchor=(0.01, 0.3),
-                        frameon=True, fancybox=True, fontsize=9)
+        legend = canvas.ax.legend(handles, labels, loc='upper left', 
+                                  bbox_to_anchor=(0.01, 0.3),
+                                  frameon=True, fancybox=True, fontsize=9)
+        # The legend sits inside the axes, so it must not shrink them
+        legend.set_in_layout(False)
     
     
     # Add grid for better readability
     canvas.ax.grid(True, linestyle='--', alpha=0.3)
     
-    # Apply tight layout before drawing
-    canvas.figure.tight_layout()
-    canvas.draw()
+    # The figure uses constrained layout, applied when it is drawn
+    canvas.draw_idle()
     
     if console:
         success_message(console, "Velocity distribution plot generated successfully")
         
         vel_stats = {
             "CDP Count": len(unique_cdps),
-            "Min Velocity": f"{min(vel):.1f} m/s",
-            "Max Velocity": f"{max(vel):.1f} m/s",
+            "Min Velocity": f"{min_vel:.1f} m/s",
+            "Max Velocity": f"{max_vel:.1f} m/s",
             "Avg Velocity": f"{np.mean(vel):.1f} m/s",
-            "Min TWT": f"{min(twt):.1f} ms",
-            "Max TWT": f"{max(twt):.1f} ms"
+            "Min TWT": f"{min_twt:.1f} ms",
+            "Max TWT": f"{max_twt:.1f} ms"
         }
         summary_statistics(console, vel_stats)
\ No newline at end of file
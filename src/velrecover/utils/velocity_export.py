@@ -1,82 +1,152 @@
 """Utility functions for exporting velocity data."""
 
 import os
+import gzip
+from functools import lru_cache
+
 import numpy as np
-import pandas as pd
-from scipy.interpolate import griddata
-import seisio  
-from ..utils.console_utils import info_message, error_message, success_message
+from scipy.ndimage import affine_transform
+from ..utils.visualization_utils import cached_segy_metadata, open_segy, segy_file_key
+
+# Grid points formatted and written per block of the text export
+EXPORT_BLOCK_ROWS = 1 << 18
+
+def _resample_grid(vel_grid, nrows, ncols):
+    """Bilinearly resample a regular grid to nrows x ncols over the same extent."""
+    # Both grids are regular, so target indices map to source indices by a
+    # per-axis scale; the C kernel applies it directly, without building
+    # coordinate arrays for the target points
+    row_scale = (vel_grid.shape[0] - 1) / (nrows - 1) if nrows > 1 else 1.0
+    col_scale = (vel_grid.shape[1] - 1) / (ncols - 1) if ncols > 1 else 1.0
+    return affine_transform(vel_grid, [row_scale, col_scale], output_shape=(nrows, ncols),
+                            order=1, mode='nearest')
+
+def _write_int_rows(f, data, rows_per_block=65536):
+    """Write an integer table to a binary file as tab-separated lines, one block of rows at a time."""
+    # One %-format over a whole block runs in C, unlike np.savetxt which
+    # formats every row separately in Python; formatting straight to bytes
+    # also skips the text layer's encoding pass
+    line = b'\t'.join([b'%d'] * data.shape[1]) + b'\n'
+    for start in range(0, len(data), rows_per_block):
+        block = data[start:start + rows_per_block]
+        f.write((line * len(block)) % tuple(block.ravel().tolist()))
 
-def save_velocity_text_data(config, segy_file_path, cdp_grid, twt_grid, vel_grid):
-    """Save interpolated velocity data to text file."""
+def _cdp_ordered_blocks(col_cdps, row_twts, vel_grid, ncdps, block_rows=EXPORT_BLOCK_ROWS):
+    """
+    Yield (cdps, twts, vels) for the grid points with CDPs in 1..ncdps, in
+    blocks of about block_rows points, ordered by CDP and keeping the grid
+    order within a CDP. vels is a fresh float array the caller may modify.
+    """
+    if np.all(np.diff(col_cdps) > 0):
+        # One column per CDP in ascending order: the rows are simply the
+        # transposed grid, so no sort is needed
+        cols = np.flatnonzero((col_cdps >= 1) & (col_cdps <= ncdps))
+        step = max(1, block_rows // len(row_twts))
+        for start in range(0, len(cols), step):
+            block = cols[start:start + step]
+            yield (np.repeat(col_cdps[block], len(row_twts)),
+                   np.tile(row_twts, len(block)),
+                   vel_grid.T[block].ravel())
+    else:
+        vel_cdps = np.broadcast_to(col_cdps, vel_grid.shape).ravel()
+        order = np.argsort(vel_cdps, kind='stable')
+        order = order[(vel_cdps[order] >= 1) & (vel_cdps[order] <= ncdps)]
+        ncols = vel_grid.shape[1]
+        flat_vels = vel_grid.ravel()
+        for start in range(0, len(order), block_rows):
+            block = order[start:start + block_rows]
+            yield vel_cdps[block], row_twts[block // ncols], flat_vels[block]
+
+@lru_cache(maxsize=4)
+def _segy_coordinates(segy_file_path, mtime_ns, size):
+    """
+    Return the X, Y source coordinates of every trace as read-only int32 arrays.
+    
+    Cached by file path, modification time and size, so repeated exports of
+    the same SEGY do not read its headers again.
+    """
+    # Read only the X, Y coordinate header words; seisio maps the file and
+    # gathers them with a strided view, so no trace samples are read
+    sio = open_segy(segy_file_path)
+    headers = sio.read_all_headers(mnemonics=["sx", "sy"], silent=True)
+    sx = np.asarray(headers["sx"], dtype=np.int32)
+    sy = np.asarray(headers["sy"], dtype=np.int32)
+    sx.flags.writeable = False
+    sy.flags.writeable = False
+    return sx, sy
+
+def _segy_dimensions(segy_file_path):
+    """Return (nsamples, ntraces) of a SEGY file."""
+    # The SEGY being interpolated has normally just been read for display, so
+    # its dimensions are taken from the shared cache without reopening it
+    metadata = cached_segy_metadata(segy_file_path)
+    if metadata is not None:
+        return metadata["nsamples"], metadata["ntraces"]
+    
+    sio = open_segy(segy_file_path)
+    return sio.nsamples, sio.ntraces
+
+def save_velocity_text_data(config, segy_file_path, cdp_grid, twt_grid, vel_grid, compress=None):
+    """
+    Save interpolated velocity data to text file.
+    
+    With compress='gzip' the file is written gzip-compressed at level 1, as
+    .dat.gz; the table is very repetitive, so this is several times smaller
+    for little extra CPU.
+    """
     try:
-        # Load the SEGY dataset for X, Y coordinates
-        sio = seisio.input(segy_file_path)
-        dataset = sio.read_dataset()
-        sx = dataset["sx"]
-        sy = dataset["sy"]
+        sx, sy = _segy_coordinates(*segy_file_key(segy_file_path))
         
         # Ensure the array dimensions align with SEGY dimensions
         if len(sx) != vel_grid.shape[1]:
             # We need to ensure the arrays have the same number of CDPs
             # If mismatched, interpolate to match the SEGY's CDP count
-            from scipy.interpolate import griddata
             
             # Get the current grid points
-            old_cdps = np.unique(cdp_grid[0, :])
-            old_twts = np.unique(twt_grid[:, 0])
+            old_cdps = cdp_grid[0, :]
+            old_twts = twt_grid[:, 0]
             
             # Create a new grid with the correct CDP count
-            new_cdps = np.linspace(min(old_cdps), max(old_cdps), len(sx))
+            new_cdps = np.linspace(old_cdps.min(), old_cdps.max(), len(sx))
             new_twts = old_twts  # Preserve time samples
             
-            # Recreate the grid with correct dimensions
-            new_cdp_grid, new_twt_grid = np.meshgrid(new_cdps, new_twts)
+            # Recreate the grid with correct dimensions, as broadcast views
+            new_cdp_grid, new_twt_grid = np.meshgrid(new_cdps, new_twts, copy=False)
             
             # Interpolate velocity values to the new grid
-            grid_points = (cdp_grid.ravel(), twt_grid.ravel())
-            vel_values = vel_grid.ravel()
-            new_grid_points = (new_cdp_grid.ravel(), new_twt_grid.ravel())
-            new_vel_grid = griddata(grid_points, vel_values, new_grid_points).reshape(new_twt_grid.shape)
+            new_vel_grid = _resample_grid(vel_grid, len(new_twts), len(new_cdps))
             
             # Update the grids for saving
             cdp_grid = new_cdp_grid
             twt_grid = new_twt_grid
             vel_grid = new_vel_grid
 
-        # Create dataframe with SEGY trace metadata
-        segy_data = pd.DataFrame({
-            'CDP': range(1, len(sx) + 1),
-            'X': sx,
-            'Y': sy
-        })
-        segy_data['CDP'] = segy_data['CDP'].astype(int)
-
-        # Create dataframe with interpolated velocities
-        vel_data = pd.DataFrame({
-            'CDP': cdp_grid.ravel().astype(int),
-            'TWT': twt_grid.ravel().astype(int),
-            'VEL': vel_grid.ravel().astype(int)
-        })
-        vel_data['CDP'] = vel_data['CDP'] + 1
+        # The grids are meshgrids, so a point's CDP depends only on its column
+        # and its TWT only on its row; CDP numbers in the file are 1-based
+        col_cdps = cdp_grid[0, :].astype(np.int32) + 1
+        row_twts = twt_grid[:, 0].astype(np.int32)
 
-        # Ensure data is in the correct byte order
-        for col in segy_data.columns:
-            if segy_data[col].dtype.byteorder == '>':
-                segy_data[col] = segy_data[col].astype(segy_data[col].dtype.newbyteorder('<'))
-
-        for col in vel_data.columns:
-            if vel_data[col].dtype.byteorder == '>':
-                vel_data[col] = vel_data[col].astype(vel_data[col].dtype.newbyteorder('<'))
-
-        # Merge datasets
-        output_data = pd.merge(segy_data, vel_data, on='CDP')
-
-        # Save data to file
+        # Save data to file through a large write buffer, building the rows a
+        # block at a time so the full output table is never held in memory
         base_name = os.path.splitext(os.path.basename(segy_file_path))[0]
         os.makedirs(config.vels_dir, exist_ok=True)
         output_path = os.path.join(config.vels_dir, f"{base_name}_interpolated_2D.dat")
-        output_data.to_csv(output_path, sep='\t', index=False)
+        if compress == 'gzip':
+            output_path += '.gz'
+            output_file = gzip.open(output_path, 'wb', compresslevel=1)
+        elif compress is None:
+            output_file = open(output_path, 'wb', buffering=1 << 20)
+        else:
+            raise ValueError(f"Unsupported compression: {compress}")
+        with output_file as f:
+            f.write(b'CDP\tX\tY\tTWT\tVEL\n')
+            for cdps, twts, vels in _cdp_ordered_blocks(col_cdps, row_twts, vel_grid, len(sx)):
+                # Round velocities to whole m/s in the gathered copy; truncating
+                # would bias every value down by half a unit on average
+                vels = np.rint(vels, out=vels).astype(np.int32)
+
+                # Join each velocity point to its trace coordinates
+                _write_int_rows(f, np.column_stack((cdps, sx[cdps - 1], sy[cdps - 1], twts, vels)))
         
         return {
             'success': True,
@@ -98,43 +168,33 @@ def save_velocity_binary_data(config, segy_file_path, vel_grid):
         base_name = os.path.splitext(os.path.basename(segy_file_path))[0]
         output_path = os.path.join(config.vels_dir, f"{base_name}_interpolated_2D.bin")
         
-        # Load SEGY info to confirm dimensions match
-        sio = seisio.input(segy_file_path)
-        nsamples = sio.nsamples
-        ntraces = sio.ntraces
+        # Look up the SEGY dimensions to confirm they match
+        nsamples, ntraces = _segy_dimensions(segy_file_path)
         
         # Check if the velocity grid has the correct dimensions
+        note = None
         if vel_grid.shape[0] != nsamples or vel_grid.shape[1] != ntraces:
             
-            # Create source and target grids
-            source_shape = vel_grid.shape
-            source_cdps = np.linspace(0, ntraces-1, source_shape[1])
-            source_twts = np.linspace(0, nsamples-1, source_shape[0])
-            source_cdp_grid, source_twt_grid = np.meshgrid(source_cdps, source_twts)
-            
-            # Create target grid with correct SEGY dimensions
-            target_cdps = np.arange(ntraces)
-            target_twts = np.arange(nsamples)
-            target_cdp_grid, target_twt_grid = np.meshgrid(target_cdps, target_twts)
-            
             # Interpolate to the correct dimensions
-            grid_points = (source_cdp_grid.ravel(), source_twt_grid.ravel())
-            vel_values = vel_grid.ravel()
-            target_points = (target_cdp_grid.ravel(), target_twt_grid.ravel())
-            resampled_vel_grid = griddata(grid_points, vel_values, target_points).reshape((nsamples, ntraces))
+            resampled_vel_grid = _resample_grid(vel_grid, nsamples, ntraces)
             
             # Use the resampled grid
             vel_grid = resampled_vel_grid
 
-            info_message(f"Resampled velocity grid to match SEGY dimensions: {nsamples} samples, {ntraces} traces.")
+            # This runs on a worker thread, so the caller reports it on the console
+            note = f"Resampled velocity grid to match SEGY dimensions: {nsamples} samples, {ntraces} traces."
         
-        vel_grid = vel_grid.T # Transpose to have a v(t,x) file format
-        vel_grid.astype('float32').tofile(output_path)
-
+        # Write the transposed grid (v(t,x) file format) straight into a
+        # memory-mapped float32 file, avoiding an intermediate full-size copy
+        output = np.memmap(output_path, dtype=np.float32, mode='w+', shape=vel_grid.T.shape)
+        output[:] = vel_grid.T
+        output.flush()
+        del output
         
         return {
             'success': True,
-            'path': output_path
+            'path': output_path,
+            'note': note
         }
     except Exception as e:
         return {
@@ -0,0 +1,45 @@
+"""Utility functions for importing velocity data."""
+
+import numpy as np
+
+def load_velocity_picks(file_path):
+    """
+    Read a velocity pick file with three columns: trace, twt, velocity.
+    
+    The delimiter (tab, comma, semicolon or whitespace) and an optional
+    header line are detected from the first line; lines starting with '#'
+    are skipped. Returns (traces, twts, values) as contiguous float64 arrays.
+    """
+    # Try to auto-detect delimiter from common formats
+    with open(file_path, 'rb') as f:
+        # Read the head of the file in one call; only the first line is inspected
+        first_line = f.read(4096).split(b'\n', 1)[0].strip()
+    
+    # Check if first line contains non-numeric characters (likely a header)
+    has_header = bool(first_line.translate(None, b'0123456789.-+\t, ;'))
+    
+    if b'\t' in first_line:
+        delimiter = '\t'  # Tab-delimited
+    elif b',' in first_line:
+        delimiter = ','   # Comma-delimited
+    elif b';' in first_line:
+        delimiter = ';'   # Semicolon-delimited
+    else:
+        delimiter = None  # Whitespace-delimited
+    
+    # Load the data with pandas' C parser, skip header row if detected
+    import pandas as pd
+    data = pd.read_csv(
+        file_path, sep=delimiter if delimiter else r'\s+', engine='c',
+        header=None, skiprows=1 if has_header else 0, comment='#', dtype=np.float64
+    ).to_numpy()
+    
+    # Check if the file has three columns
+    if data.shape[1] < 3:
+        raise ValueError("Velocity file must have at least three columns: trace, twt, velocity")
+    
+    # Extract the columns (trace number, two-way time, velocity) as
+    # three contiguous arrays; pandas hands back column-major data, so
+    # this is a view unless the frame was built row by row
+    vel_traces, vel_twts, vel_values = np.ascontiguousarray(data[:, :3].T)
+    return vel_traces, vel_twts, vel_values
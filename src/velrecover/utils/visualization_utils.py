@@ -1,9 +1,166 @@
 """Visualization utilities for VelRecover application."""
 
+import os
 import numpy as np
 import matplotlib.pyplot as plt
-import seisio
-import seisplot
+from matplotlib.colors import Normalize
+from matplotlib.ticker import FormatStrFormatter
+
+from .console_utils import console_enabled, DEBUG
+
+# Most recently read SEGY, shared by the display managers of all tabs
+_segy_cache = {"key": None, "data": None, "metadata": None, "display": None, "amplitudes": None}
+
+# Size of the trace blocks read from a SEGY file at a time
+SEGY_READ_BLOCK_BYTES = 16 << 20
+
+# Largest number of traces or samples drawn per axis; larger sections are reduced first
+MAX_DISPLAY_SIZE = 2000
+
+def segy_file_key(segy_file_path):
+    """Identify a SEGY file by path, modification time and size."""
+    stat = os.stat(segy_file_path)
+    return (os.path.abspath(segy_file_path), stat.st_mtime_ns, stat.st_size)
+
+def open_segy(segy_file_path):
+    """Open a SEGY file for reading with seisio."""
+    # seisio pulls in numba, so it is only imported once a SEGY is opened
+    import seisio
+    return seisio.input(segy_file_path)
+
+def cached_segy_metadata(segy_file_path):
+    """Return the metadata of a SEGY file if it is the one last read, else None."""
+    if _segy_cache["key"] != segy_file_key(segy_file_path):
+        return None
+    return dict(_segy_cache["metadata"])
+
+def _display_limits():
+    """
+    Return the largest (traces, samples) worth drawing on this display.
+    
+    A section never covers more device pixels than the primary screen has, so
+    that is the limit per axis, capped at MAX_DISPLAY_SIZE.
+    """
+    from PySide6.QtGui import QGuiApplication
+    
+    screen = QGuiApplication.primaryScreen() if QGuiApplication.instance() else None
+    if screen is None:
+        return MAX_DISPLAY_SIZE, MAX_DISPLAY_SIZE
+    size = screen.size() * screen.devicePixelRatio()
+    return (min(MAX_DISPLAY_SIZE, max(1, size.width())),
+            min(MAX_DISPLAY_SIZE, max(1, size.height())))
+
+def _reduce_for_display(data, max_traces=MAX_DISPLAY_SIZE, max_samples=MAX_DISPLAY_SIZE):
+    """
+    Reduce a (ntraces, nsamples) section by whole factors for display.
+    
+    An axis is only reduced when at least two of its points fall on each
+    display point, so the result never has fewer points than the display.
+    Each block of traces and samples is replaced by its largest-magnitude sample,
+    keeping its sign, so strong events survive the reduction. Returns None when
+    neither axis needs reducing.
+    """
+    ntraces, nsamples = data.shape
+    ft = max(1, ntraces // max_traces)
+    fs = max(1, nsamples // max_samples)
+    if ft == 1 and fs == 1:
+        return None
+    
+    nt, ns = ntraces // ft, nsamples // fs
+    blocks = data[:nt * ft, :ns * fs].reshape(nt, ft, ns, fs).transpose(0, 2, 1, 3).reshape(nt, ns, ft * fs)
+    idx = np.abs(blocks).argmax(axis=2)
+    reduced = np.take_along_axis(blocks, idx[..., np.newaxis], axis=2)[..., 0].astype(np.float32, copy=False)
+    
+    # Axis values spanning the same trace and sample range as the full section
+    haxis = np.linspace(0, ntraces - 1, nt)
+    vaxis = np.linspace(0, nsamples - 1, ns)
+    return reduced, haxis, vaxis
+
+def _quantize_for_display(display, amplitudes, min_levels=256):
+    """
+    Store a reduced section as int16 scaled to the full amplitude range.
+    
+    Returns (section, haxis, vaxis, scale), where section is amplitude * scale.
+    The section stays float32 (scale 1) when the median amplitude would get
+    fewer than min_levels steps, as with a few very strong spikes.
+    """
+    if display is None:
+        return None
+    
+    reduced, haxis, vaxis = display
+    if amplitudes is not None:
+        cdf, bin_width = amplitudes
+        scale = 32767 / ((len(cdf) - 1) * bin_width)
+        median_bin = int(np.searchsorted(cdf, cdf[-1] // 2))
+        if median_bin * bin_width * scale >= min_levels:
+            return np.rint(reduced * scale).astype(np.int16), haxis, vaxis, scale
+    return reduced, haxis, vaxis, 1.0
+
+def _map_segy_samples(segy_file_path, sio):
+    """
+    Map the trace samples of a SEGY file read-only, without reading them.
+    
+    Any sample format stored as a plain number (IEEE floats and integers) can
+    be mapped if the traces have a fixed length; returns None for IBM floats,
+    which need converting, and for any other layout. The (ntraces, nsamples)
+    view skips the trace headers and is backed by the OS page cache, so it
+    costs no memory of its own.
+    """
+    if sio.dataformat == 1:
+        return None
+    
+    offset = 3600 + 3200 * sio.ntxtrec
+    if offset + sio.ntraces * sio.trsize + 3200 * sio.ntxtrail != sio.fsize:
+        return None
+    
+    traces = np.memmap(segy_file_path, dtype=np.dtype(sio.trdtype), mode='r',
+                       offset=offset, shape=(sio.ntraces,))
+    return traces["data"]
+
+def _read_segy_samples(segy_file_path, sio, progress=None):
+    """
+    Read the trace samples of a SEGY file into a native-endian float32 array.
+    
+    Samples are streamed without headers in blocks of about
+    SEGY_READ_BLOCK_BYTES, so the whole file is never held twice in memory.
+    If a progress status bar is given, it counts the traces read and can
+    cancel the read between blocks.
+    """
+    data = np.empty((sio.ntraces, sio.nsamples), dtype=np.float32)
+    batch_size = max(1, SEGY_READ_BLOCK_BYTES // (4 * max(1, sio.nsamples)))
+    start = 0
+    if progress is not None:
+        progress.start(f"Reading {os.path.basename(segy_file_path)}...", sio.ntraces)
+    try:
+        for batch in sio.batches(batch_size=batch_size, mnemonics=[], silent=True):
+            data[start:start + len(batch)] = batch["data"]
+            start += len(batch)
+            if progress is not None:
+                progress.update(start)
+                if progress.wasCanceled():
+                    raise InterruptedError("SEGY loading canceled")
+    finally:
+        if progress is not None:
+            progress.finish()
+    if start != sio.ntraces:
+        raise ValueError(f"Read {start} of {sio.ntraces} traces from {os.path.basename(segy_file_path)}")
+    data.setflags(write=False)
+    return data
+
+def _amplitude_histogram(data, nbins=65536):
+    """
+    Build a cumulative histogram of absolute amplitudes for fast percentiles.
+    
+    Returns (cumulative counts, bin width), or None for an all-zero section.
+    """
+    abs_data = np.fabs(data, dtype=np.float32)
+    abs_max = float(abs_data.max())
+    if abs_max == 0:
+        return None
+    
+    bins = (abs_data * ((nbins - 1) / abs_max)).astype(np.int32)
+    cdf = np.cumsum(np.bincount(bins.ravel(), minlength=nbins))
+    return cdf, abs_max / (nbins - 1)
 
 class SeismicDisplayManager:
     """Class for managing seismic data display and velocity overlays."""
@@ -14,11 +171,33 @@ class SeismicDisplayManager:
         self.console = console
         self.perc = 75
         self.seismic_data = None
+        self._display_section = None
+        self._amplitudes = None
+        self._clip_cache = {}
         self.vel_traces = None
         self.vel_twts = None
         self.vel_values = None
+        self.vel_color_range = None
+        self._value_range_cache = (None, None, None)
+        self._sample_positions_cache = (None, None, None, None)
         self.colorbar = None
         
+        # Optional progress status bar for SEGY files that have to be read
+        self.progress = None
+        
+        # Artists kept so picks and clipping can be updated without a full redraw
+        self._seismic_image = None
+        self._image_data = None
+        self._picks_artist = None
+        
+        # Canvas contents without the (animated) picks, captured on every full
+        # draw so pick edits can be blitted over it
+        self._background = None
+        self._draw_cid = None
+        
+        # Layout engine set aside while the toolbar pans or zooms
+        self._held_layout = None
+        
         # SEGY metadata
         self.dt_ms = None  # Sample interval in milliseconds
         self.delay = None  # Delay time in milliseconds
@@ -28,29 +207,42 @@ class SeismicDisplayManager:
     def load_segy(self, segy_file_path):
 
         try:
-            # Load the SEGY data
-            sio = seisio.input(segy_file_path)
-            nsamples = sio.nsamples
-            ntraces = sio.ntraces
-            dt_ms = sio.vsi / 1000.0
-            delay = sio.delay
-            dataset = sio.read_all_traces()
-            self.seismic_data = dataset["data"]
+            # Reuse the last read SEGY if the file has not changed since
+            key = segy_file_key(segy_file_path)
+            
+            if _segy_cache["key"] != key:
+                # Load the SEGY data
+                sio = open_segy(segy_file_path)
+                data = _map_segy_samples(segy_file_path, sio)
+                if data is None:
+                    data = _read_segy_samples(segy_file_path, sio, self.progress)
+                
+                _segy_cache["key"] = key
+                _segy_cache["data"] = data
+                _segy_cache["amplitudes"] = _amplitude_histogram(data)
+                _segy_cache["display"] = _quantize_for_display(
+                    _reduce_for_display(data, *_display_limits()), _segy_cache["amplitudes"])
+                _segy_cache["metadata"] = {
+                    "nsamples": sio.nsamples,
+                    "ntraces": sio.ntraces,
+                    "dt_ms": sio.vsi / 1000.0,
+                    "delay": sio.delay
+                }
+            
+            metadata = _segy_cache["metadata"]
+            self.seismic_data = _segy_cache["data"]
+            self._display_section = _segy_cache["display"]
+            self._amplitudes = _segy_cache["amplitudes"]
+            self._clip_cache = {}
             
             # Store SEGY metadata
-            self.nsamples = nsamples
-            self.ntraces = ntraces
-            self.dt_ms = dt_ms
-            self.delay = delay
+            self.nsamples = metadata["nsamples"]
+            self.ntraces = metadata["ntraces"]
+            self.dt_ms = metadata["dt_ms"]
+            self.delay = metadata["delay"]
             
             # Return metadata
-            return {
-                "nsamples": nsamples,
-                "ntraces": ntraces,
-                "dt_ms": dt_ms,
-                "delay": delay,
-                "dataset": dataset
-            }
+            return dict(metadata)
             
         except Exception as e:
             if self.console:
@@ -72,86 +264,283 @@ class SeismicDisplayManager:
             return
         
         if clear_ax:
+            # Remove the colorbar before clearing; after ax.clear() it always raises
+            self._remove_colorbar()
             self.ax.clear()
-            if self.colorbar is not None:
-                try:
-                    self.colorbar.remove()
-                except Exception:
-                    pass
-                self.colorbar = None
-        
-        # Plot the seismic data
-        seisplot.plot(self.seismic_data, 
-                      perc=self.perc, 
-                      haxis="tracf", 
-                      hlabel="Trace Number",
-                      vlabel="Time (ms)",
-                      colormap='gray',
-                      ax=self.ax
-                      )
-        
-        # Overlay the velocity picks if available and requested
-        if redraw_picks and self.vel_traces is not None and len(self.vel_traces) > 0 and self.dt_ms is not None:
+        
+        # Plot the seismic data; large sections are drawn from the reduced copy.
+        # Both are clipped with the percentile of the full data, looked up in
+        # the cached amplitude histogram, and drawn with imshow directly since
+        # seisplot always recomputes a percentile of whatever it is given
+        clip = self._clip_value()
+        if self._display_section is None:
+            ntraces, nsamples = self.seismic_data.shape
+            self._draw_section(self.seismic_data, np.arange(ntraces), np.arange(nsamples), clip)
+        else:
+            reduced, haxis, vaxis, scale = self._display_section
+            self._draw_section(reduced, haxis, vaxis, clip * scale)
+        self._seismic_image = self.ax.images[-1]
+        self._image_data = self.seismic_data
+        self._picks_artist = None
+        self._background = None
+        
+        if self._draw_cid is None:
+            canvas = self.ax.figure.canvas
+            self._draw_cid = canvas.mpl_connect('draw_event', self._on_draw)
+            canvas.mpl_connect('button_press_event', self._hold_layout)
+            canvas.mpl_connect('button_release_event', self._release_layout)
+        
+        # Overlay the velocity picks if requested
+        if redraw_picks:
+            self._plot_picks(show_colorbar)
+        
+        return self.ax
+    
+    def update_picks(self, show_colorbar=True):
+        """
+        Redraw only the velocity picks, keeping the seismic image already on the axes.
+        
+        Returns True if the picks were blitted onto the canvas, or False if the
+        caller still has to redraw it.
+        """
+        if (self._seismic_image is None or self._seismic_image.axes is not self.ax
+                or self._image_data is not self.seismic_data):
+            self.display(show_colorbar=show_colorbar)
+            return False
+        
+        # The scatter and colorbar are updated in place; drop them only if
+        # there is nothing left for them to show
+        has_picks = self.vel_traces is not None and len(self.vel_traces) > 0 and self.dt_ms is not None
+        if not has_picks and self._picks_artist is not None:
+            # The colorbar has to go first; it needs its mappable to restore the layout
+            self._remove_colorbar()
+            if self._picks_artist.axes is self.ax:
+                self._picks_artist.remove()
+            self._picks_artist = None
+        
+        previous_artist = self._picks_artist
+        previous_colorbar = self.colorbar
+        previous_clim = previous_artist.get_clim() if previous_artist is not None else None
+        
+        self._plot_picks(show_colorbar)
+        if self._picks_artist is None or not show_colorbar:
+            self._remove_colorbar()
+        
+        # Blit when only the picks changed: same scatter, same colorbar and range
+        canvas = self.ax.figure.canvas
+        if (self._background is None or self._picks_artist is None
+                or self._picks_artist is not previous_artist
+                or self.colorbar is not previous_colorbar
+                or self._picks_artist.get_clim() != previous_clim):
+            return False
+        
+        canvas.restore_region(self._background)
+        self.ax.draw_artist(self._picks_artist)
+        canvas.blit(self.ax.bbox)
+        return True
+    
+    def _on_draw(self, event):
+        """Capture the background after a full draw and paint the picks over it."""
+        canvas = self.ax.figure.canvas
+        if canvas.is_saving() or not canvas.supports_blit:
+            # Saved figures draw animated artists themselves
+            self._background = None
+            return
+        
+        if self._picks_artist is not None and self._picks_artist.axes is self.ax:
+            self._background = canvas.copy_from_bbox(self.ax.bbox)
+            self.ax.draw_artist(self._picks_artist)
+        else:
+            self._background = None
+    
+    def _hold_layout(self, event):
+        """
+        Keep the figure layout fixed while the toolbar pans or zooms.
+        
+        Panning redraws on every mouse move, and nothing that affects the
+        layout changes until the button is released.
+        """
+        figure = self.ax.figure
+        toolbar = figure.canvas.toolbar
+        if toolbar is None or not toolbar.mode or self._held_layout is not None:
+            return
+        engine = figure.get_layout_engine()
+        if engine is not None:
+            self._held_layout = engine
+            figure.set_layout_engine('none')
+    
+    def _release_layout(self, event):
+        """Restore the layout engine set aside by _hold_layout."""
+        if self._held_layout is None:
+            return
+        figure = self.ax.figure
+        figure.set_layout_engine(self._held_layout)
+        self._held_layout = None
+        figure.canvas.draw_idle()
+    
+    def _plot_picks(self, show_colorbar):
+        """Overlay the velocity picks, if any, on the seismic image."""
+        if self.vel_traces is not None and len(self.vel_traces) > 0 and self.dt_ms is not None:
             # Create a colormap for the velocity values
             if self.vel_color_range is not None:
                 vmin, vmax = self.vel_color_range
             else:
-                vmin, vmax = np.min(self.vel_values), np.max(self.vel_values)
+                vmin, vmax = self._value_range()
                 
             # Use 'jet' colormap for consistency with interpolation display
             cmap = plt.cm.jet
             
             # Convert TWT values to sample indices for proper display
             # Formula: sample_index = (twt - delay) / dt_ms
-            if self.delay is not None:
-                # Create array of TWT values converted to proper sample positions
-                sample_positions = (self.vel_twts - self.delay) / self.dt_ms
-                
-                # Log the conversion for debugging
-                if self.console:
-                    self.console.append(f"Converting TWT values using delay={self.delay}ms, dt={self.dt_ms}ms")
-            else:
-                # If no delay information, assume zero delay
-                sample_positions = self.vel_twts / self.dt_ms
-                
-                if self.console:
-                    self.console.append("Warning: No delay information available, assuming zero delay")
+            sample_positions = self._sample_positions()
             
-            # Plot the picks as scatter points
-            sc = self.ax.scatter(self.vel_traces, sample_positions, 
-                               c=self.vel_values, cmap=cmap, 
-                               vmin=vmin, vmax=vmax,
-                               s=30, edgecolor='black', linewidth=0.5, 
-                               alpha=0.8, marker='o', zorder=10)
+            # Plot the picks as scatter points, moving and recoloring the
+            # existing scatter when there is one
+            sc = self._picks_artist
+            if sc is not None and sc.axes is self.ax:
+                sc.set_offsets(np.column_stack((self.vel_traces, sample_positions)))
+                sc.set_array(np.asarray(self.vel_values))
+                clim_changed = sc.get_clim() != (vmin, vmax)
+                if clim_changed:
+                    sc.set_clim(vmin, vmax)
+            else:
+                clim_changed = True
+                sc = self.ax.scatter(self.vel_traces, sample_positions, 
+                                   c=self.vel_values, cmap=cmap, 
+                                   vmin=vmin, vmax=vmax,
+                                   s=30, edgecolor='black', linewidth=0.5, 
+                                   alpha=0.8, marker='o', zorder=10,
+                                   animated=True)
+                self._picks_artist = sc
             
             # Add a colorbar for the velocity values only if requested
             if show_colorbar:
-                self.colorbar = self.ax.figure.colorbar(sc, ax=self.ax)
-                self.colorbar.set_label('Velocity (m/s)')
+                if self.colorbar is not None and self.colorbar.ax in self.ax.figure.axes:
+                    # Rebuilding the colorbar is only needed when its range moved
+                    if clim_changed or self.colorbar.mappable is not sc:
+                        self.colorbar.update_normal(sc)
+                else:
+                    self.colorbar = self.ax.figure.colorbar(sc, ax=self.ax)
+                    self.colorbar.set_label('Velocity (m/s)')
             
-            if self.console:
+            if self.console and console_enabled(DEBUG):
                 self.console.append(f"Plotted {len(self.vel_traces)} velocity picks with velocity range {vmin:.1f}-{vmax:.1f} m/s")
+    
+    def _sample_positions(self):
+        """
+        Return the pick TWTs as sample positions, converted once per array and timing.
         
-        return self.ax
+        Like the velocities, the TWT array is replaced rather than written
+        into on every edit, so it identifies the positions computed from it.
+        """
+        twts, delay, dt_ms, positions = self._sample_positions_cache
+        if twts is self.vel_twts and delay == self.delay and dt_ms == self.dt_ms:
+            return positions
+        
+        if self.delay is not None:
+            # Create array of TWT values converted to proper sample positions
+            positions = (self.vel_twts - self.delay) / self.dt_ms
+            
+            # Log the conversion for debugging
+            if self.console and console_enabled(DEBUG):
+                self.console.append(f"Converting TWT values using delay={self.delay}ms, dt={self.dt_ms}ms")
+        else:
+            # If no delay information, assume zero delay
+            positions = self.vel_twts / self.dt_ms
+            
+            if self.console:
+                self.console.append("Warning: No delay information available, assuming zero delay")
+        
+        self._sample_positions_cache = (self.vel_twts, self.delay, self.dt_ms, positions)
+        return positions
+    
+    def _value_range(self):
+        """
+        Return the (min, max) of the pick velocities, reduced once per array.
+        
+        Pick edits and undo/redo replace the arrays rather than writing into
+        them, so the array itself identifies the values the range belongs to.
+        """
+        values, vmin, vmax = self._value_range_cache
+        if values is not self.vel_values:
+            vmin, vmax = np.min(self.vel_values), np.max(self.vel_values)
+            self._value_range_cache = (self.vel_values, vmin, vmax)
+        return vmin, vmax
+    
+    def _draw_section(self, section, haxis, vaxis, clip):
+        """Draw a (ntraces, nsamples) section in gray, laid out as seisplot draws it."""
+        self.ax.set_facecolor("white")
+        self.ax.imshow(section.T, cmap='gray', norm=Normalize(vmin=-clip, vmax=clip),
+                       interpolation="bilinear", origin="upper", aspect="auto",
+                       extent=[haxis[0], haxis[-1], vaxis.max(), vaxis.min()])
+        
+        # Integer axis values get integer tick labels
+        if np.all(np.mod(haxis, 1) == 0):
+            self.ax.xaxis.set_major_formatter(FormatStrFormatter('%d'))
+        if np.all(np.mod(vaxis, 1) == 0):
+            self.ax.yaxis.set_major_formatter(FormatStrFormatter('%d'))
+        self.ax.tick_params(which='major', direction="out", labelsize=10, length=6,
+                            labelcolor="black", color="black", width=1)
+        self.ax.tick_params(which='minor', direction="out", length=4,
+                            labelcolor="black", color="black", width=0.8)
+        self.ax.grid(visible=False)
+        self.ax.set_xlabel("Trace Number", fontsize=12, color="black")
+        self.ax.set_ylabel("Time (ms)", fontsize=12, color="black")
+    
+    def _remove_colorbar(self):
+        """Remove the velocity colorbar if it is still attached to the figure."""
+        if self.colorbar is not None:
+            if self.colorbar.ax in self.ax.figure.axes:
+                self.colorbar.remove()
+            self.colorbar = None
+    
+    def _clip_value(self):
+        """Return the amplitude clip for the current percentile, cached per loaded SEGY."""
+        clip = self._clip_cache.get(self.perc)
+        if clip is None:
+            if self._amplitudes is None:
+                # All-zero section; any symmetric range will do
+                clip = 1.0
+            else:
+                # Walk the cumulative amplitude histogram instead of sorting the
+                # data; the result is exact to within one bin (max/65535)
+                cdf, bin_width = self._amplitudes
+                rank = self.perc / 100 * (cdf[-1] - 1)
+                idx = int(np.searchsorted(cdf, rank, side='right'))
+                abs_max = (len(cdf) - 1) * bin_width
+                clip = min((idx + 0.5) * bin_width, abs_max) if idx > 0 else 0.0
+                if clip == 0:
+                    clip = abs_max
+            self._clip_cache[self.perc] = clip
+        return clip
     
     def clear(self):
         """Clear the display and reset the data."""
         self.seismic_data = None
+        self._display_section = None
         self.vel_traces = None
         self.vel_twts = None
         self.vel_values = None
         
+        # Colorbar removal - same as in display method
+        self._remove_colorbar()
         self.ax.clear()
-        # Safer colorbar removal - same as in display method
-        if self.colorbar is not None:
-            try:
-                self.colorbar.remove()
-            except Exception as e:
-                pass
-            self.colorbar = None
+        self._seismic_image = None
+        self._image_data = None
+        self._picks_artist = None
+        self._background = None
         
         self.ax.set_title("No seismic data loaded")
         
     def set_percentile(self, perc):
         """ Set the percentile value for seismic amplitude scaling."""
-        self.perc = perc
\ No newline at end of file
+        self.perc = perc
+        
+        # Only the clip range changes, so rescale the image already drawn
+        if self.seismic_data is not None and self._seismic_image is not None and self._seismic_image.axes is self.ax:
+            clip = self._clip_value()
+            if self._display_section is not None:
+                # The reduced section is stored in scaled int16 units
+                clip *= self._display_section[3]
+            self._seismic_image.set_clim(-clip, clip)
+            self._background = None
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""Tests for the Gaussian blur of velocity grids."""
+
+import numpy as np
+import cv2
+
+from velrecover.core.gauss_blur import apply_gaussian_blur
+
+
+def _velocity_grid(nrows, ncols):
+    """Velocity-like grid: a time trend, lateral variation and a sharp block."""
+    rng = np.random.default_rng(0)
+    twt = np.linspace(0, 4600, nrows)[:, np.newaxis]
+    trace = np.arange(ncols)[np.newaxis, :]
+    grid = 1500 + 0.6 * twt + 300 * np.sin(trace / 37.0) + 50 * rng.random((nrows, ncols))
+    grid += 400 * ((trace > ncols // 3) & (twt > 2000))
+    return grid.astype(np.float32)
+
+
+def _exact_blur(grid, blur_value):
+    kernel_size = int(max(3, blur_value * 20 + 1)) | 1
+    return cv2.GaussianBlur(grid, (kernel_size, kernel_size), 0)
+
+
+def test_pyramid_blur_matches_exact_blur():
+    grid = _velocity_grid(700, 400)
+    for blur_value in (8, 12, 19):
+        blurred = apply_gaussian_blur(grid, blur_value)
+        assert blurred.shape == grid.shape
+        assert np.abs(blurred - _exact_blur(grid, blur_value)).max() < 2.0
+
+
+def test_pyramid_blur_writes_into_out():
+    grid = _velocity_grid(700, 400)
+    expected = apply_gaussian_blur(grid, 10)
+    out = grid.copy()
+    assert apply_gaussian_blur(out, 10, out=out) is out
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_kernel_larger_than_grid_uses_exact_blur():
+    grid = _velocity_grid(200, 120)
+    np.testing.assert_allclose(apply_gaussian_blur(grid, 50), _exact_blur(grid, 50), atol=1e-2)
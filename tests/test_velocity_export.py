@@ -0,0 +1,42 @@
+"""Tests for the velocity grid exports."""
+
+import os
+import gzip
+from types import SimpleNamespace
+
+import numpy as np
+
+from velrecover.utils.velocity_export import save_velocity_binary_data, save_velocity_text_data
+
+SEGY_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "src", "velrecover",
+                         "examples", "SEGY", "RIV6.segy")
+
+
+def test_binary_export_resamples_to_segy_dimensions(tmp_path):
+    nsamples, ntraces = 1151, 514
+    vel_grid = np.repeat(np.linspace(1500, 4500, 200, dtype=np.float32)[:, np.newaxis], 100, axis=1)
+
+    result = save_velocity_binary_data(SimpleNamespace(vels_dir=str(tmp_path)), SEGY_PATH, vel_grid)
+
+    assert result['success'], result.get('error')
+    assert "Resampled" in result['note']
+    saved = np.fromfile(result['path'], dtype=np.float32).reshape(ntraces, nsamples)
+    np.testing.assert_allclose(saved[:, 0], 1500)
+    np.testing.assert_allclose(saved[:, -1], 4500)
+
+
+def test_compressed_text_export_matches_plain_export(tmp_path):
+    ntraces = 514
+    twts = np.linspace(0, 4000, 50)
+    cdp_grid, twt_grid = np.meshgrid(np.arange(ntraces), twts)
+    vel_grid = (1500 + 0.5 * twt_grid + cdp_grid).astype(np.float32)
+
+    plain = save_velocity_text_data(SimpleNamespace(vels_dir=str(tmp_path)), SEGY_PATH,
+                                    cdp_grid, twt_grid, vel_grid)
+    compressed = save_velocity_text_data(SimpleNamespace(vels_dir=str(tmp_path)), SEGY_PATH,
+                                         cdp_grid, twt_grid, vel_grid, 'gzip')
+
+    assert plain['success'] and compressed['success']
+    assert compressed['path'].endswith(".dat.gz")
+    with open(plain['path'], 'rb') as f, gzip.open(compressed['path'], 'rb') as g:
+        assert g.read() == f.read()
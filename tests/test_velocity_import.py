@@ -0,0 +1,26 @@
+"""Tests for reading velocity pick files."""
+
+import numpy as np
+
+from velrecover.utils.velocity_import import load_velocity_picks
+
+
+def test_header_and_delimiter_detected(tmp_path):
+    path = tmp_path / "picks.csv"
+    path.write_text("Trace,TWT,Velocity\n1,100,1500\n# skipped\n2,200.5,1600\n")
+
+    traces, twts, values = load_velocity_picks(str(path))
+
+    np.testing.assert_array_equal(traces, [1, 2])
+    np.testing.assert_array_equal(twts, [100, 200.5])
+    np.testing.assert_array_equal(values, [1500, 1600])
+    assert traces.flags.c_contiguous and values.flags.c_contiguous
+
+
+def test_whitespace_file_without_header(tmp_path):
+    path = tmp_path / "picks.dat"
+    path.write_text("1  100  1500\n2  200  1600\n3  300  1700\n")
+
+    traces, twts, values = load_velocity_picks(str(path))
+
+    np.testing.assert_array_equal(values, [1500, 1600, 1700])
@@ -0,0 +1,46 @@
+"""Tests for the seismic section display."""
+
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import seisplot
+
+from velrecover.utils.visualization_utils import SeismicDisplayManager, _reduce_for_display
+
+
+def _render(draw):
+    fig = Figure(figsize=(8, 6), constrained_layout=True)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    draw(ax)
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+
+def test_section_drawn_as_seisplot_draws_it():
+    rng = np.random.default_rng(0)
+    section = rng.standard_normal((300, 500)).astype(np.float32)
+    haxis = np.arange(300)
+    vaxis = np.linspace(0, 1999, 500)
+    clip = 1.3
+
+    expected = _render(lambda ax: seisplot.plot(
+        section, lowclip=-clip, highclip=clip, haxis=haxis, vaxis=vaxis,
+        hlabel="Trace Number", vlabel="Time (ms)", colormap='gray', ax=ax))
+
+    manager = SeismicDisplayManager(None)
+    actual = _render(lambda ax: (setattr(manager, "ax", ax),
+                                 manager._draw_section(section, haxis, vaxis, clip)))
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_section_not_reduced_below_display_size():
+    section = np.zeros((514, 1151), dtype=np.float32)
+    assert _reduce_for_display(section, 1920, 1080) is None
+
+    section = np.zeros((514, 2400), dtype=np.float32)
+    reduced, haxis, vaxis = _reduce_for_display(section, 1920, 1080)
+    assert reduced.shape == (514, 1200)
+    assert vaxis[-1] == 2399